@@ -7,7 +7,6 @@ Supports averaging results across multiple runs.
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -135,11 +134,21 @@ class CachedModelResult(BaseModel):
         )
 
 
+class CachedFileStamp(BaseModel):
+    """Modification times of an evaluated model output and its source of truth."""
+    model_key: str
+    model_mtime_ns: int
+    source_mtime_ns: int
+
+
 class EvaluationCache(BaseModel):
     """Cache for all evaluation results."""
     source_file: str
     last_updated: str = Field(default_factory=lambda: datetime.now().isoformat())
     models: dict[str, CachedModelResult] = Field(default_factory=dict)
+
+    # Model output file -> mtimes at the time it was last evaluated
+    evaluated_files: dict[str, CachedFileStamp] = Field(default_factory=dict)
     
     def get_or_create_model(self, model_id: str, provider: str) -> CachedModelResult:
         """Get existing model cache or create new one."""
@@ -170,6 +179,38 @@ class EvaluationCache(BaseModel):
         )
         model_cache.add_run(result, cost, input_tokens, output_tokens)
         self.last_updated = datetime.now().isoformat()
+
+    def record_file(
+        self,
+        model_file: str | Path,
+        model_key: str,
+        model_mtime_ns: int,
+        source_mtime_ns: int,
+    ) -> None:
+        """Remember the mtimes a model output was evaluated at."""
+        self.evaluated_files[str(model_file)] = CachedFileStamp(
+            model_key=model_key,
+            model_mtime_ns=model_mtime_ns,
+            source_mtime_ns=source_mtime_ns,
+        )
+
+    def get_unchanged_model(
+        self,
+        model_file: str | Path,
+        model_mtime_ns: int,
+        source_mtime_ns: int,
+    ) -> CachedModelResult | None:
+        """
+        Get the cached result for a model output if neither it nor the source changed.
+
+        Returns None if the file was never evaluated or either mtime differs.
+        """
+        stamp = self.evaluated_files.get(str(model_file))
+        if stamp is None:
+            return None
+        if stamp.model_mtime_ns != model_mtime_ns or stamp.source_mtime_ns != source_mtime_ns:
+            return None
+        return self.models.get(stamp.model_key)
     
     def get_rankings(self) -> list[tuple[str, float, int]]:
         """
@@ -234,9 +275,7 @@ def load_cache(source_file: str | Path, cache_dir: str | Path = "evaluation_resu
     
     if cache_path.exists():
         try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return EvaluationCache.model_validate(data)
+            return EvaluationCache.model_validate_json(cache_path.read_bytes())
         except Exception as e:
             print(f"Warning: Failed to load cache from {cache_path}: {e}")
     
@@ -250,8 +289,7 @@ def save_cache(cache: EvaluationCache, cache_dir: str | Path = "evaluation_resul
     
     cache_path = get_cache_path(cache.source_file, cache_dir)
     
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(cache.model_dump(mode="json"), f, indent=2)
+    cache_path.write_text(cache.model_dump_json(indent=2), encoding="utf-8")
     
     return cache_path
 
@@ -7,10 +7,11 @@ exact matching for boolean/enum fields and normalized comparison for lists.
 
 from __future__ import annotations
 
-import json
 from difflib import SequenceMatcher
 from pathlib import Path
 
+from pydantic_core import from_json
+
 from evaluation.models import (
     FieldEvaluation,
     SectionEvaluation,
@@ -21,8 +22,7 @@ from evaluation.models import (
 
 def load_json_file(file_path: str | Path) -> dict:
     """Load JSON from file path."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return from_json(Path(file_path).read_bytes())
 
 
 def extract_sections(json_data: dict) -> list[dict]:
@@ -33,20 +33,20 @@ def extract_sections(json_data: dict) -> list[dict]:
     """
     sections: list[dict] = []
     
-    # Remove metadata
-    data = {k: v for k, v in json_data.items() if k != "_metadata"}
-    
-    versions = data.get("versions", [])
+    # Only "versions" is read, so "_metadata" needs no stripping (and no copy)
+    versions = json_data.get("versions", [])
     if not versions:
         return sections
     
     # Use first version
     structure = versions[0].get("structure", {})
     
-    # Collect all sections (could be nested)
-    def collect_sections(section: dict) -> None:
+    # Collect all sections (could be nested) in document order, using an
+    # explicit stack so deep nesting can't hit the recursion limit
+    stack = [structure]
+    while stack:
+        section = stack.pop()
         fields = section.get("fields", [])
-        subsections = section.get("sections", [])
         
         # If this section has fields, add it
         if fields:
@@ -56,11 +56,9 @@ def extract_sections(json_data: dict) -> list[dict]:
                 "fields": fields,
             })
         
-        # Recurse into subsections
-        for subsection in subsections:
-            collect_sections(subsection)
+        # Subsections are pushed in reverse so the first one is visited next
+        stack.extend(reversed(section.get("sections", [])))
     
-    collect_sections(structure)
     return sections
 
 
@@ -397,9 +395,25 @@ def compare_templates(
     Returns:
         List of SectionEvaluation for each source section
     """
-    source_sections = extract_sections(source_json)
-    model_sections = extract_sections(model_json)
+    return compare_section_lists(extract_sections(source_json), extract_sections(model_json))
+
+
+def compare_section_lists(
+    source_sections: list[dict],
+    model_sections: list[dict],
+) -> list[SectionEvaluation]:
+    """
+    Compare sections already pulled out with extract_sections().
     
+    Lets callers that also need the section counts walk each template once.
+    
+    Args:
+        source_sections: Sections of the source of truth
+        model_sections: Sections of the model output
+        
+    Returns:
+        List of SectionEvaluation for each source section
+    """
     # Match sections
     section_matches = match_sections(source_sections, model_sections)
     
@@ -14,6 +14,7 @@ import boto3  # type: ignore[import-untyped]
 from botocore.config import Config  # type: ignore[import-untyped]
 from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 from pydantic import BaseModel
+from pydantic_core import from_json
 
 from evaluation.models import (
     SectionEvaluation,
@@ -236,9 +237,9 @@ class LLMEvaluator:
         result_text = self._clean_json_response(result_text)
         
         try:
-            result_dict = json.loads(result_text)
+            result_dict = from_json(result_text)
             return LLMEvaluationResponse.model_validate(result_dict)
-        except (json.JSONDecodeError, Exception) as e:
+        except Exception as e:
             log(f"Failed to parse LLM response: {e}")
             log(f"Response: {result_text[:500]}...")
             return self._create_fallback_response(section_evaluations)
@@ -248,15 +249,16 @@ class LLMEvaluator:
         Extract sections and fields for comparison (condensed format).
         """
         extracted_sections: list[dict] = []
-        data = {k: v for k, v in json_data.items() if k != "_metadata"}
-        
-        versions = data.get("versions", [])
+        versions = json_data.get("versions", [])
         if not versions:
             return extracted_sections
         
         structure = versions[0].get("structure", {})
         
-        def extract_sections(section: dict) -> None:
+        # Depth-first in document order, with an explicit stack instead of recursion
+        stack = [structure]
+        while stack:
+            section = stack.pop()
             fields = section.get("fields", [])
             if fields:
                 extracted_sections.append({
@@ -271,22 +273,13 @@ class LLMEvaluator:
                     ]
                 })
             
-            for subsection in section.get("sections", []):
-                extract_sections(subsection)
+            stack.extend(reversed(section.get("sections", [])))
         
-        extract_sections(structure)
         return extracted_sections
     
     def _clean_json_response(self, text: str) -> str:
         """Clean markdown formatting from JSON response."""
-        text = text.strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        if text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        return text.strip()
+        return text.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
     
     def _create_fallback_response(
         self,
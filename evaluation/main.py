@@ -20,7 +20,7 @@ from evaluation.models import (
 from evaluation.schema_validator import validate_schema
 from evaluation.field_comparator import (
     load_json_file,
-    compare_templates,
+    compare_section_lists,
     extract_sections,
 )
 from evaluation.llm_evaluator import (
@@ -151,7 +151,9 @@ def evaluate_single_model(
     
     # Level 2: Deterministic comparison
     log("Level 2: Deterministic Comparison...")
-    section_evaluations = compare_templates(source_json, model_json)
+    source_sections = extract_sections(source_json)
+    model_sections = extract_sections(model_json)
+    section_evaluations = compare_section_lists(source_sections, model_sections)
     log(f"  Sections compared: {len(section_evaluations)}")
     
     # Level 3: LLM semantic evaluation
@@ -182,10 +184,6 @@ def evaluate_single_model(
     
     duration_ms = int((time.time() - start_time) * 1000)
     
-    # Count source sections
-    source_sections = extract_sections(source_json)
-    model_sections = extract_sections(model_json)
-    
     return EvaluationResult(
         source_file=str(source_path),
         model_file=str(model_path),
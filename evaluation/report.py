@@ -6,7 +6,6 @@ Generates evaluation reports in JSON, HTML, and console formats.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from tabulate import tabulate  # type: ignore[import-untyped]
@@ -33,11 +32,9 @@ def generate_json_report(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Serialize using Pydantic
-    report_dict = report.model_dump(mode="json")
-    
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(report_dict, f, indent=indent, ensure_ascii=False)
+    # Serialize straight to JSON with pydantic-core, without building the
+    # intermediate model_dump() dict tree
+    output_path.write_text(report.model_dump_json(indent=indent), encoding="utf-8")
     
     return output_path
 
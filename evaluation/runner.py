@@ -8,6 +8,7 @@ Called automatically from main.py after generating outputs.
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TypedDict
 
@@ -18,7 +19,7 @@ from evaluation.models import (
 from evaluation.schema_validator import validate_schema
 from evaluation.field_comparator import (
     load_json_file,
-    compare_templates,
+    compare_section_lists,
     extract_sections,
 )
 from evaluation.scorer import (
@@ -34,6 +35,10 @@ from evaluation.cache import (
 from src.utils.logger import log
 
 
+# Small shared pool used to overlap JSON file reads with scoring work
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="eval-io")
+
+
 class UsageData(TypedDict):
     """Usage data for a single model run."""
     cost: float
@@ -92,6 +97,8 @@ def extract_usage_from_metadata(json_data: dict) -> UsageData:
 def evaluate_model_output(
     source_path: Path,
     model_path: Path,
+    source_json: dict | None = None,
+    model_json: dict | None = None,
 ) -> EvaluationResult:
     """
     Evaluate a single model output against source of truth.
@@ -101,15 +108,21 @@ def evaluate_model_output(
     Args:
         source_path: Path to source of truth JSON
         model_path: Path to model output JSON
+        source_json: Already-loaded source of truth JSON (read from source_path if None)
+        model_json: Already-loaded model output JSON (read from model_path if None)
         
     Returns:
         EvaluationResult with all scores
     """
     start_time = time.time()
     
-    # Load files
-    source_json = load_json_file(source_path)
-    model_json = load_json_file(model_path)
+    # Load files concurrently, skipping any the caller already read
+    source_read = _IO_EXECUTOR.submit(load_json_file, source_path) if source_json is None else None
+    model_read = _IO_EXECUTOR.submit(load_json_file, model_path) if model_json is None else None
+    if source_read is not None:
+        source_json = source_read.result()
+    if model_read is not None:
+        model_json = model_read.result()
     
     # Extract metadata
     metadata = extract_metadata(model_json, model_path)
@@ -117,8 +130,11 @@ def evaluate_model_output(
     # Level 1: Schema validation
     schema_result = validate_schema(model_json)
     
-    # Level 2: Deterministic comparison
-    section_evaluations = compare_templates(source_json, model_json)
+    # Level 2: Deterministic comparison (sections are extracted once, for both
+    # the comparison and the section counts)
+    source_sections = extract_sections(source_json)
+    model_sections = extract_sections(model_json)
+    section_evaluations = compare_section_lists(source_sections, model_sections)
     
     # Score all fields (using deterministic scores only)
     section_evaluations = score_all_fields(section_evaluations)
@@ -128,10 +144,6 @@ def evaluate_model_output(
     
     duration_ms = int((time.time() - start_time) * 1000)
     
-    # Count sections
-    source_sections = extract_sections(source_json)
-    model_sections = extract_sections(model_json)
-    
     return EvaluationResult(
         source_file=str(source_path),
         model_file=str(model_path),
@@ -166,10 +178,14 @@ def run_evaluation_for_outputs(
     cache_dir: Path,
     usage_data: dict[str, UsageData] | None = None,
     quiet: bool = False,
+    force: bool = False,
 ) -> dict[str, EvaluationCache]:
     """
     Run evaluation for multiple model outputs and update caches.
 
+    Outputs whose file and source of truth are unchanged since they were last
+    evaluated are skipped and their cached result is reported instead.
+
     Args:
         model_output_paths: List of model output JSON files
         source_of_truth_dir: Directory containing source of truth files
@@ -177,6 +193,7 @@ def run_evaluation_for_outputs(
         usage_data: Optional dict mapping "{provider}:{model_id}" to UsageData.
                     If not provided, usage will be read from each file's _metadata.
         quiet: If True, suppress detailed output
+        force: If True, re-evaluate every output even if unchanged
 
     Returns:
         Dictionary mapping source files to their updated caches
@@ -215,9 +232,40 @@ def run_evaluation_for_outputs(
         # Load existing cache
         cache = load_cache(source_path, cache_dir)
 
+        # Skip outputs that haven't changed since they were last evaluated
+        source_mtime_ns = source_path.stat().st_mtime_ns
+        pending: list[tuple[Path, int]] = []
+
         for output_path in output_paths:
+            model_mtime_ns = output_path.stat().st_mtime_ns
+            cached = None if force else cache.get_unchanged_model(
+                output_path, model_mtime_ns, source_mtime_ns
+            )
+            if cached is None:
+                pending.append((output_path, model_mtime_ns))
+            elif not quiet:
+                log(f"  [{cached.provider}] {cached.model_id}: "
+                    f"{cached.latest_score*100:.1f}% (unchanged, cached)")
+
+        # Source of truth is shared by every output in this group, so read it once
+        # (and not at all when every output is cached); model outputs are read
+        # one step ahead of the output being scored
+        source_read = _IO_EXECUTOR.submit(load_json_file, source_path) if pending else None
+        next_read = _IO_EXECUTOR.submit(load_json_file, pending[0][0]) if pending else None
+
+        for i, (output_path, model_mtime_ns) in enumerate(pending):
+            model_read = next_read
+            if i + 1 < len(pending):
+                next_read = _IO_EXECUTOR.submit(load_json_file, pending[i + 1][0])
+
             try:
-                result = evaluate_model_output(source_path, output_path)
+                model_json = model_read.result()
+                result = evaluate_model_output(
+                    source_path,
+                    output_path,
+                    source_json=source_read.result(),
+                    model_json=model_json,
+                )
 
                 # Get usage data for this model - first try passed usage_data,
                 # then fall back to reading from the output file's _metadata
@@ -226,7 +274,6 @@ def run_evaluation_for_outputs(
 
                 if not model_usage:
                     # Read usage from the output file's _metadata
-                    model_json = load_json_file(output_path)
                     model_usage = extract_usage_from_metadata(model_json)
 
                 # Add evaluation with usage data
@@ -236,6 +283,7 @@ def run_evaluation_for_outputs(
                     input_tokens=model_usage.get("input_tokens", 0),
                     output_tokens=model_usage.get("output_tokens", 0),
                 )
+                cache.record_file(output_path, model_key, model_mtime_ns, source_mtime_ns)
 
                 cost_str = f" (${model_usage.get('cost', 0):.4f})" if model_usage.get("cost", 0) > 0 else ""
                 if not quiet:
@@ -261,6 +309,7 @@ def run_post_extraction_evaluation(
     cache_dir: Path | None = None,
     usage_data: dict[str, UsageData] | None = None,
     quiet: bool = False,
+    force: bool = False,
 ) -> None:
     """
     Run evaluation automatically after PDF extraction.
@@ -276,6 +325,7 @@ def run_post_extraction_evaluation(
         usage_data: Optional dict mapping "{provider}:{model_id}" to UsageData
                     containing cost and token information
         quiet: If True, suppress output
+        force: If True, re-evaluate outputs even if unchanged since the last run
     """
     if source_of_truth_dir is None:
         source_of_truth_dir = output_dir / "source_of_truth"
@@ -335,6 +385,7 @@ def run_post_extraction_evaluation(
         cache_dir=cache_dir,
         usage_data=usage_data,
         quiet=quiet,
+        force=force,
     )
     
     # Print summary for each cache
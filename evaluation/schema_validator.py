@@ -9,12 +9,18 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from pydantic import ValidationError as PydanticValidationError
+from pydantic import TypeAdapter, ValidationError as PydanticValidationError
+from pydantic_core import SchemaValidator, from_json
 
 from src.schemas.inspection import InspectionTemplate
 from evaluation.models import SchemaValidationResult, ValidationError
 
 
+# Core validator is built once at import and reused for every model output,
+# skipping the per-call model_validate dispatch
+_VALIDATOR: SchemaValidator = TypeAdapter(InspectionTemplate).validator
+
+
 def validate_schema(json_data: dict) -> SchemaValidationResult:
     """
     Validate JSON data against the InspectionTemplate schema.
@@ -27,11 +33,15 @@ def validate_schema(json_data: dict) -> SchemaValidationResult:
     """
     errors: list[ValidationError] = []
     
-    # Remove metadata field if present (added by our extraction process)
-    data_to_validate = {k: v for k, v in json_data.items() if k != "_metadata"}
+    # Remove metadata field if present (added by our extraction process);
+    # only copy the dict when there is actually something to strip
+    if "_metadata" in json_data:
+        data_to_validate = {k: v for k, v in json_data.items() if k != "_metadata"}
+    else:
+        data_to_validate = json_data
     
     try:
-        InspectionTemplate.model_validate(data_to_validate)
+        _VALIDATOR.validate_python(data_to_validate)
         return SchemaValidationResult(
             is_valid=True,
             errors=[],
@@ -39,7 +49,8 @@ def validate_schema(json_data: dict) -> SchemaValidationResult:
             compliance_score=1.0
         )
     except PydanticValidationError as e:
-        for error in e.errors():
+        # URLs are skipped: they are not shown and cost a lookup per error
+        for error in e.errors(include_url=False):
             # Build the path string from error location
             path_parts = [str(p) for p in error.get("loc", [])]
             path = ".".join(path_parts) if path_parts else "root"
@@ -50,7 +61,10 @@ def validate_schema(json_data: dict) -> SchemaValidationResult:
             if input_value is not None:
                 try:
                     if isinstance(input_value, (dict, list)):
-                        value_str = json.dumps(input_value)[:100] + "..." if len(json.dumps(input_value)) > 100 else json.dumps(input_value)
+                        # Serialize once; a wrong-shaped section can be large
+                        value_str = json.dumps(input_value)
+                        if len(value_str) > 100:
+                            value_str = value_str[:100] + "..."
                     else:
                         value_str = str(input_value)[:100]
                 except Exception:
@@ -97,9 +111,8 @@ def validate_schema_from_file(file_path: str | Path) -> SchemaValidationResult:
         )
     
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            json_data = json.load(f)
-    except json.JSONDecodeError as e:
+        json_data = from_json(path.read_bytes())
+    except ValueError as e:
         return SchemaValidationResult(
             is_valid=False,
             errors=[ValidationError(path="json", message=f"Invalid JSON: {str(e)}")],
@@ -128,11 +141,13 @@ def _count_total_fields(json_data: dict) -> int:
 
 
 def _count_fields_in_section(section: dict) -> int:
-    """Recursively count fields in a section."""
-    count = len(section.get("fields", []))
-    
-    for subsection in section.get("sections", []):
-        count += _count_fields_in_section(subsection)
+    """Count fields in a section and all of its nested subsections."""
+    count = 0
+    stack = [section]
+    while stack:
+        current = stack.pop()
+        count += len(current.get("fields", []))
+        stack.extend(current.get("sections", []))
     
     return count
 
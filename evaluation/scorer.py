@@ -61,22 +61,21 @@ def calculate_field_score(field_eval: FieldEvaluation) -> float:
         mandatory_score = 1.0 if config.mandatory else 0.0
         
         # Notes config (avg of 3 fields)
-        notes_booleans = [config.notes_enabled, config.notes_required_for_all_options]
-        notes_boolean_score = sum(1.0 for b in notes_booleans if b) / len(notes_booleans)
+        notes_boolean_score = (int(config.notes_enabled) + int(config.notes_required_for_all_options)) / 2
         notes_score = (notes_boolean_score + config.notes_required_for_selected_options) / 2
         
         # Attachments config (avg of 3 fields)
-        attach_booleans = [config.attachments_enabled, config.attachments_required_for_all_options]
-        attach_boolean_score = sum(1.0 for b in attach_booleans if b) / len(attach_booleans)
+        attach_boolean_score = (
+            int(config.attachments_enabled) + int(config.attachments_required_for_all_options)
+        ) / 2
         attach_score = (attach_boolean_score + config.attachments_required_for_selected_options) / 2
         
         # Work order config (avg of 3 fields)
-        work_order_fields = [
-            config.can_create_work_order,
-            config.work_order_category,
-            config.work_order_sub_category,
-        ]
-        work_order_score = sum(1.0 for b in work_order_fields if b) / len(work_order_fields)
+        work_order_score = (
+            int(config.can_create_work_order)
+            + int(config.work_order_category)
+            + int(config.work_order_sub_category)
+        ) / 3
     else:
         mandatory_score = 0.0
         notes_score = 0.0
@@ -7,20 +7,28 @@ Generates charts and graphs for evaluation results using matplotlib and plotly.
 from __future__ import annotations
 
 import math
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add parent directory to path for direct script execution
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-import matplotlib.pyplot as plt  # type: ignore[import-untyped]
-import numpy as np
-
 from evaluation.models import (
     EvaluationResult,
     ComparisonReport,
 )
 
+if TYPE_CHECKING:
+    from types import ModuleType
+    import numpy as np
+    from matplotlib.axes import Axes  # type: ignore[import-untyped]
+    from matplotlib.figure import Figure  # type: ignore[import-untyped]
+
 
 # Color palette for charts
 COLORS = {
@@ -32,6 +40,15 @@ COLORS = {
     "neutral": "#6b7280",      # Gray
 }
 
+# Resolution for every saved chart; 100 DPI is plenty for report PNGs
+CHART_DPI = 100
+
+# Characters in model ids that can't appear in chart filenames
+_FILENAME_TABLE = str.maketrans({"/": "_", ":": "_"})
+
+# Fast zlib level for PNG output: slightly larger files, much cheaper encode
+PNG_SAVE_OPTIONS = {"compress_level": 1, "optimize": False}
+
 SCORE_COLORS = [
     "#dc2626",  # 0-20% Red
     "#ea580c",  # 20-40% Orange
@@ -41,6 +58,25 @@ SCORE_COLORS = [
 ]
 
 
+@lru_cache(maxsize=1)
+def _pyplot() -> ModuleType:
+    """
+    Import and configure pyplot on first use.
+    
+    matplotlib is only loaded once a chart is actually rendered, so importing
+    this module stays cheap. Batch rendering only ever writes PNGs, so the
+    non-interactive backend is pinned before pyplot is imported to skip GUI
+    toolkit initialization.
+    """
+    import matplotlib  # type: ignore[import-untyped]
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt  # type: ignore[import-untyped]
+    
+    plt.rcParams["figure.dpi"] = CHART_DPI
+    plt.rcParams["savefig.dpi"] = CHART_DPI
+    return plt
+
+
 def get_score_color(score: float) -> str:
     """Get color based on score value (0.0-1.0)."""
     idx = min(int(score * 5), 4)
@@ -63,35 +99,31 @@ def create_bar_chart(
     Returns:
         Path to saved chart
     """
+    import numpy as np
+    
+    plt = _pyplot()
     output_path = Path(output_path)
     
     # Extract data
-    model_names = [r.metadata.model_id for r in results]
-    scores = [r.scores.overall_score * 100 for r in results]
-    colors = [get_score_color(r.scores.overall_score) for r in results]
-    
-    # Sort by score descending
-    sorted_data = sorted(zip(model_names, scores, colors), key=lambda x: x[1], reverse=True)
-    if sorted_data:
-        model_names_sorted, scores_sorted, colors_sorted = zip(*sorted_data)
-        model_names = list(model_names_sorted)
-        scores = list(scores_sorted)
-        colors = list(colors_sorted)
-    else:
-        model_names, scores, colors = [], [], []
+    raw_scores = np.fromiter((r.scores.overall_score for r in results), dtype=np.float64, count=len(results))
+    
+    # Sort by score descending (stable, so ties keep their input order)
+    order = np.argsort(-raw_scores, kind="stable")
+    model_names = [results[i].metadata.model_id for i in order]
+    colors = [get_score_color(score) for score in raw_scores[order]]
+    scores = raw_scores[order] * 100
     
     # Create figure
     _, ax = plt.subplots(figsize=(10, max(4, len(model_names) * 0.8)))
     
     # Create horizontal bars
     y_pos = np.arange(len(model_names))
-    bars = ax.barh(y_pos, scores, color=colors, edgecolor="white", linewidth=0.5)
+    ax.barh(y_pos, scores, color=colors, edgecolor="white", linewidth=0.5)
     
-    # Add score labels
-    for bar, score in zip(bars, scores):
-        width = bar.get_width()
-        ax.text(width + 1, bar.get_y() + bar.get_height()/2,
-                f"{score:.1f}%", va="center", ha="left", fontsize=10, fontweight="bold")
+    # Add score labels; barh centers each bar on its y position, so the
+    # label coordinates come straight from the arrays
+    for x, y, score in zip(scores + 1, y_pos, scores):
+        ax.text(x, y, f"{score:.1f}%", va="center", ha="left", fontsize=10, fontweight="bold")
     
     # Customize
     ax.set_yticks(y_pos)
@@ -110,12 +142,33 @@ def create_bar_chart(
     ax.spines["right"].set_visible(False)
     
     plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight", facecolor="white")
+    plt.savefig(output_path, dpi=CHART_DPI, facecolor="white", pil_kwargs=PNG_SAVE_OPTIONS)
     plt.close()
     
     return output_path
 
 
+@lru_cache(maxsize=32)
+def _radar_angles(num_dims: int) -> np.ndarray:
+    """Get the closed-loop axis angles for a radar chart (read-only, cached)."""
+    import numpy as np
+    
+    angles = np.linspace(0, 2 * math.pi, num_dims, endpoint=False)
+    angles = np.append(angles, angles[0])  # Complete the loop
+    angles.flags.writeable = False
+    return angles
+
+
+@lru_cache(maxsize=32)
+def _radar_colors(num_models: int) -> np.ndarray:
+    """Get one Set2 color per model for a radar chart (read-only, cached)."""
+    import numpy as np
+    
+    colors = _pyplot().cm.Set2(np.linspace(0, 1, num_models))
+    colors.flags.writeable = False
+    return colors
+
+
 def create_radar_chart(
     results: list[EvaluationResult],
     output_path: str | Path,
@@ -132,36 +185,45 @@ def create_radar_chart(
     Returns:
         Path to saved chart
     """
+    import numpy as np
+    
+    plt = _pyplot()
     output_path = Path(output_path)
     
     # Dimensions to compare
     dimensions = ["Schema", "Structure", "Semantic", "Config"]
     num_dims = len(dimensions)
     
-    # Calculate angles for radar
-    angles = [n / float(num_dims) * 2 * math.pi for n in range(num_dims)]
-    angles += angles[:1]  # Complete the loop
+    # Angles for radar, closed back to the first axis
+    angles = _radar_angles(num_dims)
     
-    # Create figure
-    _, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
+    # One row of scores per model, first column repeated to close the loop
+    scores = np.array([
+        [
+            r.scores.schema_compliance,
+            r.scores.structural_accuracy,
+            r.scores.semantic_accuracy,
+            r.scores.config_accuracy,
+        ]
+        for r in results
+    ], dtype=np.float64).reshape(len(results), num_dims)
+    scores = np.hstack([scores, scores[:, :1]])
+    
+    # Place the axes explicitly, leaving margins for the axis labels and a
+    # strip on the right for the legend, so no tight bbox pass is needed
+    fig = plt.figure(figsize=(12, 8))
+    ax = fig.add_axes((0.07, 0.07, 0.53, 0.8), polar=True)
     
     # Colors for each model
-    model_colors = plt.cm.Set2(np.linspace(0, 1, len(results)))
-    
-    for i, result in enumerate(results):
-        # Extract scores
-        scores = [
-            result.scores.schema_compliance,
-            result.scores.structural_accuracy,
-            result.scores.semantic_accuracy,
-            result.scores.config_accuracy,
-        ]
-        scores += scores[:1]  # Complete the loop
-        
-        # Plot
-        ax.plot(angles, scores, "o-", linewidth=2, 
-                label=result.metadata.model_id, color=model_colors[i])
-        ax.fill(angles, scores, alpha=0.15, color=model_colors[i])
+    model_colors = _radar_colors(len(results))
+    
+    # Plot every model's outline in one call, then label and color each line;
+    # fills don't take a 2-D y, so they stay per model
+    lines = ax.plot(angles, scores.T, "o-", linewidth=2)
+    for line, result, model_scores, color in zip(lines, results, scores, model_colors):
+        line.set_color(color)
+        line.set_label(result.metadata.model_id)
+        ax.fill(angles, model_scores, alpha=0.15, color=color)
     
     # Customize
     ax.set_xticks(angles[:-1])
@@ -171,11 +233,10 @@ def create_radar_chart(
     ax.set_yticklabels(["20%", "40%", "60%", "80%", "100%"], fontsize=9)
     ax.set_title(title, fontsize=14, fontweight="bold", pad=20)
     
-    # Legend
-    ax.legend(loc="upper right", bbox_to_anchor=(1.3, 1.0), fontsize=9)
+    # Legend in the strip reserved to the right of the axes
+    fig.legend(loc="upper left", bbox_to_anchor=(0.66, 0.87), fontsize=9)
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight", facecolor="white")
+    plt.savefig(output_path, dpi=CHART_DPI, facecolor="white", pil_kwargs=PNG_SAVE_OPTIONS)
     plt.close()
     
     return output_path
@@ -185,6 +246,7 @@ def create_heatmap(
     result: EvaluationResult,
     output_path: str | Path,
     title: str | None = None,
+    fig: Figure | None = None,
 ) -> Path:
     """
     Create a heatmap showing section-wise accuracy for a single model.
@@ -193,10 +255,14 @@ def create_heatmap(
         result: Single evaluation result
         output_path: Path to save the chart
         title: Chart title (defaults to model name)
+        fig: Optional figure to clear and draw into; left open for reuse
         
     Returns:
         Path to saved chart
     """
+    import numpy as np
+    
+    plt = _pyplot()
     output_path = Path(output_path)
     
     if title is None:
@@ -205,36 +271,42 @@ def create_heatmap(
     sections = result.sections
     if not sections:
         # Create empty chart
-        fig, ax = plt.subplots(figsize=(8, 4))
+        ax = _heatmap_axes(fig, (8, 4))
         ax.text(0.5, 0.5, "No sections to display", ha="center", va="center")
-        plt.savefig(output_path, dpi=150, bbox_inches="tight", facecolor="white")
-        plt.close()
+        ax.figure.savefig(output_path, dpi=CHART_DPI, facecolor="white", pil_kwargs=PNG_SAVE_OPTIONS)
+        if fig is None:
+            plt.close(ax.figure)
         return output_path
     
     # Prepare data
     section_names = [s.source_section_name[:20] for s in sections]
     metrics = ["Name Match", "Field Count", "Avg Field Score", "Section Score"]
     
-    # Build data matrix
-    data_list: list[list[float]] = []
-    for section in sections:
-        field_scores = [f.overall_score for f in section.fields]
-        avg_score = float(np.mean(field_scores)) if field_scores else 0.0
-        row = [
-            section.section_name_similarity,
-            1.0 if section.field_count_match else 0.0,
-            avg_score,
-            section.section_score,
-        ]
-        data_list.append(row)
+    # Build data matrix column-by-column from flat arrays
+    num_sections = len(sections)
+    field_counts = np.fromiter((len(s.fields) for s in sections), dtype=np.intp, count=num_sections)
+    field_scores = np.fromiter(
+        (f.overall_score for s in sections for f in s.fields),
+        dtype=np.float64,
+        count=int(field_counts.sum()),
+    )
+    # Per-section field score sums in one pass (sections without fields sum to 0)
+    section_index = np.repeat(np.arange(num_sections), field_counts)
+    score_sums = np.bincount(section_index, weights=field_scores, minlength=num_sections)
     
-    data = np.array(data_list)
+    data = np.empty((num_sections, len(metrics)), dtype=np.float64)
+    data[:, 0] = np.fromiter((s.section_name_similarity for s in sections), dtype=np.float64, count=num_sections)
+    data[:, 1] = np.fromiter((s.field_count_match for s in sections), dtype=np.float64, count=num_sections)
+    data[:, 2] = score_sums / np.maximum(field_counts, 1)
+    data[:, 3] = np.fromiter((s.section_score for s in sections), dtype=np.float64, count=num_sections)
     
-    # Create figure
-    _, ax = plt.subplots(figsize=(10, max(4, len(sections) * 0.5)))
+    # Create figure (or clear the caller's)
+    ax = _heatmap_axes(fig, (10, max(4, len(sections) * 0.5)))
     
-    # Create heatmap
-    im = ax.imshow(data, cmap="RdYlGn", aspect="auto", vmin=0, vmax=1)
+    # Create heatmap from a row-major float32 copy (the column-wise fill above
+    # doesn't guarantee layout, and the colormap needs far less than float64);
+    # the annotations below keep reading the float64 values
+    im = ax.imshow(np.ascontiguousarray(data, dtype=np.float32), cmap="RdYlGn", aspect="auto", vmin=0, vmax=1)
     
     # Set ticks
     ax.set_xticks(np.arange(len(metrics)))
@@ -245,26 +317,36 @@ def create_heatmap(
     # Rotate x labels
     plt.setp(ax.get_xticklabels(), rotation=45, ha="right", rotation_mode="anchor")
     
-    # Add text annotations
-    for i in range(len(section_names)):
-        for j in range(len(metrics)):
-            value = float(data[i][j])
-            text_color = "white" if value < 0.5 else "black"
-            ax.text(j, i, f"{value:.2f}", ha="center", va="center",
-                   color=text_color, fontsize=9)
+    # Add text annotations (colors and labels computed for the whole matrix)
+    text_colors = np.where(data < 0.5, "white", "black")
+    labels = np.char.mod("%.2f", data)
+    for i, j in np.ndindex(data.shape):
+        ax.text(j, i, labels[i, j], ha="center", va="center",
+               color=text_colors[i, j], fontsize=9)
     
     # Title and colorbar
     ax.set_title(title, fontsize=14, fontweight="bold", pad=20)
     cbar = ax.figure.colorbar(im, ax=ax, shrink=0.8)
     cbar.ax.set_ylabel("Score", rotation=-90, va="bottom", fontsize=10)
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight", facecolor="white")
-    plt.close()
+    ax.figure.tight_layout()
+    ax.figure.savefig(output_path, dpi=CHART_DPI, facecolor="white", pil_kwargs=PNG_SAVE_OPTIONS)
+    if fig is None:
+        plt.close(ax.figure)
     
     return output_path
 
 
+def _heatmap_axes(fig: Figure | None, figsize: tuple[float, float]) -> Axes:
+    """Get fresh axes on a new figure, or on a cleared and resized existing one."""
+    if fig is None:
+        _, ax = _pyplot().subplots(figsize=figsize)
+        return ax
+    fig.clf()
+    fig.set_size_inches(figsize)
+    return fig.add_subplot()
+
+
 def create_summary_table_image(
     results: list[EvaluationResult],
     output_path: str | Path,
@@ -281,13 +363,16 @@ def create_summary_table_image(
     Returns:
         Path to saved image
     """
+    plt = _pyplot()
     output_path = Path(output_path)
     
     # Prepare data
     columns = ["Model", "Schema", "Structure", "Semantic", "Config", "Overall"]
     rows = []
+    overall_colors = []
     
     for result in sorted(results, key=lambda r: r.scores.overall_score, reverse=True):
+        overall_colors.append(get_score_color(result.scores.overall_score))
         rows.append([
             result.metadata.model_id[:30],
             f"{result.scores.schema_compliance*100:.1f}%",
@@ -301,10 +386,12 @@ def create_summary_table_image(
     _, ax = plt.subplots(figsize=(12, max(3, len(rows) * 0.5 + 1)))
     ax.axis("off")
     
-    # Create table
+    # Create table; header and overall score cells are colored at construction
     table = ax.table(
         cellText=rows,
         colLabels=columns,
+        cellColours=[["white"] * (len(columns) - 1) + [color] for color in overall_colors],
+        colColours=[COLORS["primary"]] * len(columns),
         loc="center",
         cellLoc="center",
     )
@@ -314,27 +401,30 @@ def create_summary_table_image(
     table.set_fontsize(10)
     table.scale(1.2, 1.5)
     
-    # Header styling
-    for j, _ in enumerate(columns):
-        cell = table[(0, j)]
-        cell.set_facecolor(COLORS["primary"])
-        cell.set_text_props(color="white", fontweight="bold")
-    
-    # Color code overall score cells
-    for i, result in enumerate(sorted(results, key=lambda r: r.scores.overall_score, reverse=True)):
-        cell = table[(i + 1, 5)]
-        cell.set_facecolor(get_score_color(result.scores.overall_score))
-        cell.set_text_props(color="white", fontweight="bold")
+    # White bold text on the colored header and overall score cells
+    highlighted = [(0, j) for j in range(len(columns))] + [(i, len(columns) - 1) for i in range(1, len(rows) + 1)]
+    for key in highlighted:
+        table[key].set_text_props(color="white", fontweight="bold")
     
     ax.set_title(title, fontsize=14, fontweight="bold", pad=20)
     
     plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight", facecolor="white")
+    plt.savefig(output_path, dpi=CHART_DPI, facecolor="white", pil_kwargs=PNG_SAVE_OPTIONS)
     plt.close()
     
     return output_path
 
 
+def _render_heatmaps(jobs: list[tuple[EvaluationResult, Path]]) -> list[Path]:
+    """Render a batch of heatmaps into one shared figure (runs in a worker process)."""
+    plt = _pyplot()
+    fig = plt.figure(figsize=(10, 6))
+    try:
+        return [create_heatmap(result, path, fig=fig) for result, path in jobs]
+    finally:
+        plt.close(fig)
+
+
 def generate_all_charts(
     report: ComparisonReport,
     output_dir: str | Path,
@@ -342,6 +432,10 @@ def generate_all_charts(
     """
     Generate all visualization charts for a comparison report.
     
+    Charts are independent and CPU-bound, so on multi-core machines they
+    are rendered across a process pool; heatmaps are split into one batch
+    per worker so each worker still reuses a single figure.
+    
     Args:
         report: ComparisonReport with evaluation results
         output_dir: Directory to save charts
@@ -352,37 +446,56 @@ def generate_all_charts(
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    charts: dict[str, Path] = {}
-    
     if not report.evaluations:
+        return {}
+    
+    # Summary charts over all models
+    summary_jobs = [
+        ("bar_chart", create_bar_chart),
+        ("radar_chart", create_radar_chart),
+        ("summary_table", create_summary_table_image),
+    ]
+    
+    # Heatmaps for each model (a repeated model id keeps its last result,
+    # so no two workers ever write the same file)
+    heatmaps: dict[str, tuple[EvaluationResult, Path]] = {}
+    for result in report.evaluations:
+        model_name = result.metadata.model_id.translate(_FILENAME_TABLE)
+        heatmaps[f"heatmap_{model_name}"] = (result, output_dir / f"heatmap_{model_name}.png")
+    heatmap_names = list(heatmaps)
+    heatmap_jobs = list(heatmaps.values())
+    
+    workers = min(os.cpu_count() or 1, len(summary_jobs) + len(heatmap_jobs))
+    
+    # Single core: a process pool would only add startup and pickling cost
+    if workers <= 1:
+        charts = {
+            name: render(report.evaluations, output_dir / f"{name}.png")
+            for name, render in summary_jobs
+        }
+        charts.update(zip(heatmap_names, _render_heatmaps(heatmap_jobs)))
         return charts
     
-    # Bar chart
-    charts["bar_chart"] = create_bar_chart(
-        report.evaluations,
-        output_dir / "bar_chart.png",
-    )
-    
-    # Radar chart
-    charts["radar_chart"] = create_radar_chart(
-        report.evaluations,
-        output_dir / "radar_chart.png",
-    )
-    
-    # Summary table
-    charts["summary_table"] = create_summary_table_image(
-        report.evaluations,
-        output_dir / "summary_table.png",
-    )
-    
-    # Heatmaps for each model
-    for result in report.evaluations:
-        model_name = result.metadata.model_id.replace("/", "_").replace(":", "_")
-        chart_path = create_heatmap(
-            result,
-            output_dir / f"heatmap_{model_name}.png",
-        )
-        charts[f"heatmap_{model_name}"] = chart_path
+    # Spawn rather than fork: the evaluation runner's I/O threads may be
+    # alive, and forking a multi-threaded process can deadlock the children
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        summary_futures = [
+            (name, executor.submit(render, report.evaluations, output_dir / f"{name}.png"))
+            for name, render in summary_jobs
+        ]
+        # Strided batches keep every worker's heatmap share the same size
+        heatmap_futures = [
+            (heatmap_names[start::workers], executor.submit(_render_heatmaps, heatmap_jobs[start::workers]))
+            for start in range(min(workers, len(heatmap_jobs)))
+        ]
+        
+        charts = {name: future.result() for name, future in summary_futures}
+        heatmap_paths: dict[str, Path] = {}
+        for names, future in heatmap_futures:
+            heatmap_paths.update(zip(names, future.result()))
     
+    # Keep heatmaps in report order regardless of how they were batched
+    charts.update((name, heatmap_paths[name]) for name in heatmap_names)
     return charts
-
@@ -5,28 +5,56 @@ Main entry point for benchmarking PDF document extraction
 across multiple providers and models.
 """
 
-import json
+import argparse
+import filecmp
+import hashlib
+import os
+import shutil
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+from PIL import Image, PngImagePlugin
+from pydantic_core import from_json, to_json
+
 from src.config import Provider, load_config, ModelConfig
 from src.config.loader import AppConfig
 from src.services import get_service
 from src.schemas import InspectionTemplate
-from src.utils import pdf_to_images, log, get_tracker, reset_tracker
+from src.utils import pdf_to_images, log, get_tracker, reset_tracker, capture_usage
 
 # Evaluation imports
 from evaluation.runner import run_post_extraction_evaluation
 
+# Section separator for log banners, built once instead of per PDF
+_SEPARATOR = "=" * 70
+
+
+@lru_cache(maxsize=32)
+def _load_template_file(resolved_path: str, mtime_ns: int) -> dict:
+    # mtime_ns is only part of the cache key, so an edited file is re-read
+    return from_json(Path(resolved_path).read_bytes())
+
 
 def load_template(template_path: str | Path) -> dict:
-    """Load a JSON template from file."""
-    with open(template_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """
+    Load a JSON template from file.
+    
+    Parsed once per file version and shared by every run that uses it, so
+    the returned dict must not be modified by callers.
+    """
+    path = Path(template_path).resolve()
+    return _load_template_file(str(path), path.stat().st_mtime_ns)
+
+
+_SANITIZE_TABLE = str.maketrans({".": "_", "/": "_", ":": "_"})
 
 
 def sanitize_name(name: str) -> str:
     """Sanitize name for use in file paths."""
-    return name.replace(".", "_").replace("/", "_").replace(":", "_")
+    return name.translate(_SANITIZE_TABLE)
 
 
 def get_model_display_name(model_config: ModelConfig) -> str:
@@ -47,10 +75,14 @@ def get_output_path(
     
     Structure: output/{provider}/{model}/{pdf_stem}.json
     """
-    provider_name = sanitize_name(provider.value)
-    model_name = sanitize_name(get_model_display_name(model_config))
-    
-    return base_output_dir / provider_name / model_name / f"{pdf_stem}.json"
+    model_dir = _model_output_dir(base_output_dir, provider, get_model_display_name(model_config))
+    return model_dir / f"{pdf_stem}.json"
+
+
+@lru_cache(maxsize=64)
+def _model_output_dir(base_output_dir: Path, provider: Provider, model_display: str) -> Path:
+    """Output directory for one provider/model (built once, reused for every PDF)."""
+    return base_output_dir / sanitize_name(provider.value) / sanitize_name(model_display)
 
 
 def save_result(
@@ -65,8 +97,10 @@ def save_result(
     """Save extraction result to JSON file with usage metadata."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Handle both dict and Pydantic model results
-    result_dict = result if isinstance(result, dict) else result.model_dump()
+    # Handle both dict and Pydantic model results with a shallow copy: a model
+    # is only unpacked one level and its nested models are serialized directly
+    # by pydantic-core, skipping the full model_dump() dict tree
+    result_dict = dict(result)
 
     # Attach metadata so evaluation can identify provider/model AND usage
     result_dict["_metadata"] = {
@@ -78,12 +112,94 @@ def save_result(
         "cost_usd": cost_usd,
     }
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(result_dict, f, indent=2)
+    # Serialize with pydantic-core's native JSON writer rather than json.dump
+    # (field names, not aliases, to match model_dump())
+    data = to_json(result_dict, indent=2, by_alias=False)
+    
+    # Leave an identical output untouched (e.g. a run replayed from the response
+    # cache) so its mtime doesn't make evaluation record a new run
+    if output_path.exists() and output_path.read_bytes() == data:
+        log(f"Output unchanged: {output_path}")
+        return
+    output_path.write_bytes(data)
     
     log(f"Output saved to {output_path}")
 
 
+# Bump when the cached page format changes (2: text layer stored with each page)
+_PAGE_CACHE_VERSION = 2
+
+
+def _cached_pdf_to_images(
+    pdf_path: Path,
+    cache_root: Path,
+    dpi: int = 144,
+    save_dir: Path | None = None,
+    with_text_layer: bool = False,
+) -> list[Image.Image]:
+    """
+    Convert a PDF to images, reusing pages rendered on a previous run.
+    
+    Pages are cached under cache_root by a hash of the PDF bytes, the DPI and
+    whether text layers were extracted, so an edited PDF is always re-rendered.
+    
+    Args:
+        pdf_path: Path to the input PDF file
+        cache_root: Directory holding cached page renders
+        dpi: Resolution for rendering
+        save_dir: Optional directory to also export the page images to
+        with_text_layer: Keep born-digital pages' text in img.info["text_layer"]
+        
+    Returns:
+        List of PIL Image objects, one per page
+    """
+    with open(pdf_path, "rb") as f:
+        digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+    text_suffix = "_text" if with_text_layer else ""
+    cache_dir = cache_root / f"{digest}_{dpi}{text_suffix}_v{_PAGE_CACHE_VERSION}"
+    
+    if cache_dir.is_dir():
+        page_paths = sorted(cache_dir.glob("page_*.png"), key=lambda p: int(p.stem.split("_")[1]))
+        # Load eagerly: the images are shared across extraction threads
+        images = [Image.open(p).convert("RGB") for p in page_paths]
+        log(f"Loaded {len(images)} cached page image(s) for {pdf_path.name}")
+    else:
+        images = pdf_to_images(pdf_path, dpi=dpi, with_text_layer=with_text_layer)
+        
+        # Write into a scratch dir and rename, so a partial cache is never read
+        tmp_dir = cache_root / f"{cache_dir.name}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        for page_num, img in enumerate(images, start=1):
+            # Keep the page's text layer in an iTXt chunk; it comes back in img.info
+            pnginfo = None
+            if "text_layer" in img.info:
+                pnginfo = PngImagePlugin.PngInfo()
+                pnginfo.add_itxt("text_layer", img.info["text_layer"])
+            img.save(tmp_dir / f"page_{page_num}.png", format="PNG", pnginfo=pnginfo)
+        try:
+            tmp_dir.rename(cache_dir)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        page_paths = [cache_dir / f"page_{n}.png" for n in range(1, len(images) + 1)]
+    
+    # Export copies of the cached pages, matching pdf_to_images' naming; an
+    # existing export is only kept if it matches (the PDF may have been edited)
+    if save_dir:
+        save_dir.mkdir(parents=True, exist_ok=True)
+        for page_num, page_path in enumerate(page_paths, start=1):
+            target = save_dir / f"{pdf_path.stem}_page_{page_num}.png"
+            if not target.exists() or not filecmp.cmp(page_path, target, shallow=False):
+                shutil.copyfile(page_path, target)
+    
+    return images
+
+
+def _uses_text_layer(config: AppConfig, providers: list[Provider]) -> bool:
+    """Check whether any of the providers will read pages' text layers."""
+    return config.providers.deepseek.use_text_layer and Provider.DEEPSEEK in providers
+
+
 def process_pdf(
     pdf_path: Path,
     output_dir: Path,
@@ -120,23 +236,23 @@ def process_pdf(
     if images is None:
         images = pdf_to_images(
             pdf_path,
-            save_dir=save_images_dir
+            dpi=config.output.page_dpi,
+            save_dir=save_images_dir,
+            with_text_layer=_uses_text_layer(config, [provider]),
         )
         log(f"Converted PDF to {len(images)} image(s)")
     
     # Load template context if provided
     context = load_template(template_path) if template_path else None
     
-    # Get tracker to capture usage before and after
-    tracker = get_tracker()
-    records_before = len(tracker.records)
-    
-    # Extract JSON using the service
-    result = service.generate_json(
-        images=images,
-        schema=InspectionTemplate,
-        context=context,
-    )
+    # Extract JSON using the service, capturing only this call's usage
+    # (other models may be logging to the global tracker concurrently)
+    with capture_usage() as usage_records:
+        result = service.generate_json(
+            images=images,
+            schema=InspectionTemplate,
+            context=context,
+        )
     
     # Capture usage data from this extraction
     input_tokens = 0
@@ -144,7 +260,7 @@ def process_pdf(
     cost_usd = 0.0
     
     # Sum up all new records (there might be multiple API calls)
-    for record in tracker.records[records_before:]:
+    for record in usage_records:
         input_tokens += record.input_tokens
         output_tokens += record.output_tokens
         cost_usd += record.cost_usd
@@ -180,22 +296,32 @@ def get_provider_models(provider: Provider, config: AppConfig) -> list[ModelConf
             return []
 
 
+def count_pdf_files(input_dir: Path) -> int:
+    """Count the PDF files in a directory without building a list of paths."""
+    with os.scandir(input_dir) as entries:
+        return sum(1 for entry in entries if entry.name.endswith(".pdf") and entry.is_file())
+
+
 def run_benchmark(
-    pdf_files: list[Path],
+    pdf_files: Iterable[Path],
     output_dir: Path,
     config: AppConfig,
     template_path: Path | None = None,
     images_dir: Path | None = None,
+    pdf_count: int | None = None,
+    max_concurrent_pdfs: int = 1,
 ) -> None:
     """
     Run benchmark across all configured providers and models.
     
     Args:
-        pdf_files: List of PDF files to process
+        pdf_files: PDF files to process (may be a lazy iterator)
         output_dir: Base output directory
         config: App configuration
         template_path: Optional template path for context
         images_dir: Optional directory to save images
+        pdf_count: Number of PDFs, required when pdf_files has no len()
+        max_concurrent_pdfs: How many PDFs may have extraction runs in flight at once
     """
     # Collect all provider/model combinations
     benchmark_configs: list[tuple[Provider, ModelConfig]] = []
@@ -209,10 +335,14 @@ def run_benchmark(
         log("No models configured for benchmarking. Check your config.yaml")
         return
     
-    total_runs = len(benchmark_configs) * len(pdf_files)
+    if pdf_count is None:
+        pdf_files = list(pdf_files)
+        pdf_count = len(pdf_files)
+    
+    total_runs = len(benchmark_configs) * pdf_count
     log("Benchmark Configuration:")
     log(f"  - Providers/Models: {len(benchmark_configs)}")
-    log(f"  - PDF Files: {len(pdf_files)}")
+    log(f"  - PDF Files: {pdf_count}")
     log(f"  - Total Runs: {total_runs}")
     log("")
     
@@ -223,50 +353,252 @@ def run_benchmark(
     log("")
     
     run_count = 0
+    page_cache_root = Path(config.output.page_cache_dir)
+    with_text_layer = _uses_text_layer(config, [provider for provider, _ in benchmark_configs])
     
-    # Process each PDF file
-    for pdf_path in pdf_files:
-        log("=" * 70)
-        log(f"PDF: {pdf_path.name}")
-        log("=" * 70)
-        
-        # Convert PDF to images once per PDF (reuse across models)
-        images = pdf_to_images(pdf_path, save_dir=images_dir)
-        log(f"Converted PDF to {len(images)} image(s)")
-        
-        # Run extraction for each provider/model combination
-        for provider, model_config in benchmark_configs:
+    def render(pdf_path: Path) -> list[Image.Image]:
+        # Convert PDF to images once per PDF (reuse across models and runs)
+        return _cached_pdf_to_images(
+            pdf_path,
+            cache_root=page_cache_root,
+            dpi=config.output.page_dpi,
+            save_dir=images_dir,
+            with_text_layer=with_text_layer,
+        )
+    
+    def report(
+        pdf_path: Path,
+        images: list[Image.Image],
+        futures: dict[Future, tuple[Provider, ModelConfig]],
+    ) -> None:
+        # Log each run of one PDF as it finishes
+        nonlocal run_count
+        for future in as_completed(futures):
+            provider, model_config = futures[future]
             run_count += 1
             model_display = get_model_display_name(model_config)
             
-            log("-" * 70)
-            log(f"[{run_count}/{total_runs}] {provider.value} / {model_display}")
-            log("-" * 70)
-            
             try:
-                process_pdf(
+                future.result()
+                log(f"[{run_count}/{total_runs}] SUCCESS: {pdf_path.name} with {provider.value}/{model_display}")
+            except Exception as e:
+                log(f"[{run_count}/{total_runs}] ERROR: {pdf_path.name} with {provider.value}/{model_display}: {e}")
+        log("")
+        
+        # Every run of this PDF is done; free the decoded pages now rather than
+        # whenever the last reference (e.g. a stored exception's traceback) goes
+        for img in images:
+            img.close()
+    
+    # Process each PDF file. A single background worker renders the next PDF
+    # while extraction calls are in flight, and up to max_concurrent_pdfs PDFs
+    # share one extraction pool, so a slow model on one PDF doesn't hold up
+    # the next. Pages of at most max_concurrent_pdfs + 1 PDFs are held in memory.
+    max_concurrent_pdfs = max(1, max_concurrent_pdfs)
+    in_flight: deque[tuple[Path, list[Image.Image], dict[Future, tuple[Provider, ModelConfig]]]] = deque()
+    pdf_iter = iter(pdf_files)
+    with (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-render") as renderer,
+        ThreadPoolExecutor(max_workers=len(benchmark_configs) * max_concurrent_pdfs) as executor,
+    ):
+        next_pdf = next(pdf_iter, None)
+        pending = renderer.submit(render, next_pdf) if next_pdf is not None else None
+        
+        while pending is not None:
+            pdf_path = next_pdf
+            log(_SEPARATOR)
+            log(f"PDF: {pdf_path.name}")
+            log(_SEPARATOR)
+            
+            images = pending.result()
+            log(f"Converted PDF to {len(images)} image(s)")
+            
+            next_pdf = next(pdf_iter, None)
+            pending = renderer.submit(render, next_pdf) if next_pdf is not None else None
+            
+            # Run extraction for every provider/model combination concurrently;
+            # calls are network-bound, so wall time is the slowest model's latency
+            futures = {
+                executor.submit(
+                    process_pdf,
                     pdf_path=pdf_path,
                     output_dir=output_dir,
                     provider=provider,
                     model_config=model_config,
                     config=config,
                     template_path=template_path,
-                    images=images,  # Reuse converted images
-                )
-                log(f"SUCCESS: {pdf_path.name} with {provider.value}/{model_display}")
-            except Exception as e:
-                log(f"ERROR: {pdf_path.name} with {provider.value}/{model_display}: {e}")
+                    images=images,  # Reuse converted images (read-only)
+                ): (provider, model_config)
+                for provider, model_config in benchmark_configs
+            }
+            in_flight.append((pdf_path, images, futures))
+            
+            # Wait for the oldest PDF once the window is full
+            if len(in_flight) >= max_concurrent_pdfs:
+                report(*in_flight.popleft())
         
-        log("")
+        while in_flight:
+            report(*in_flight.popleft())
+
+
+# Batches submitted by --openai-batch submit and not yet collected
+_BATCH_MANIFEST = "openai_batches.json"
+
+
+def submit_openai_batches(
+    pdf_files: Iterable[Path],
+    output_dir: Path,
+    config: AppConfig,
+    template_path: Path | None = None,
+    images_dir: Path | None = None,
+) -> None:
+    """
+    Submit every PDF to each configured OpenAI model as Batch API jobs.
+    
+    Batches cost half as much but may take up to 24h; their ids are recorded
+    in a manifest under output_dir for collect_openai_batches() to pick up.
+    
+    Args:
+        pdf_files: PDF files to submit
+        output_dir: Base output directory (holds the batch manifest)
+        config: App configuration
+        template_path: Optional template path for context
+        images_dir: Optional directory to save images
+    """
+    model_configs = get_provider_models(Provider.OPENAI, config)
+    if not model_configs:
+        log("No OpenAI models configured for batch submission. Check your config.yaml")
+        return
+    
+    # Batch custom ids are length-limited, so documents get short ids and the
+    # manifest maps them back to their PDFs
+    pdf_paths = {f"doc{index}": pdf_path for index, pdf_path in enumerate(pdf_files)}
+    if not pdf_paths:
+        log("No PDF files to submit")
+        return
+    
+    page_cache_root = Path(config.output.page_cache_dir)
+    documents = {
+        doc_id: _cached_pdf_to_images(
+            pdf_path, cache_root=page_cache_root, dpi=config.output.page_dpi, save_dir=images_dir
+        )
+        for doc_id, pdf_path in pdf_paths.items()
+    }
+    context = load_template(template_path) if template_path else None
+    
+    manifest_path = output_dir / _BATCH_MANIFEST
+    manifest = from_json(manifest_path.read_bytes()) if manifest_path.exists() else []
+    try:
+        for model_config in model_configs:
+            service = get_service(Provider.OPENAI, config, model_config)
+            batch_id = service.submit_batch(documents, schema=InspectionTemplate, context=context)
+            manifest.append({
+                "batch_id": batch_id,
+                "model_id": model_config.model_id,
+                "documents": {doc_id: str(pdf_path) for doc_id, pdf_path in pdf_paths.items()},
+            })
+            # Record each batch as soon as it exists, so a later failure
+            # doesn't lose track of the ones already submitted
+            manifest_path.write_bytes(to_json(manifest, indent=2))
+    finally:
+        for images in documents.values():
+            for img in images:
+                img.close()
+    
+    log(f"Submitted {len(model_configs)} batch(es); run with --openai-batch collect to fetch results")
+
+
+def collect_openai_batches(output_dir: Path, config: AppConfig) -> None:
+    """
+    Save the results of finished OpenAI batches listed in the manifest.
+    
+    Each finished batch's documents are written with save_result() like any
+    other run; batches still in progress (or that failed to load) stay in the
+    manifest for the next collect.
+    
+    Args:
+        output_dir: Base output directory (holds the batch manifest)
+        config: App configuration
+    """
+    manifest_path = output_dir / _BATCH_MANIFEST
+    if not manifest_path.exists():
+        log(f"No submitted batches found ({manifest_path})")
+        return
+    
+    configured = {m.model_id: m for m in get_provider_models(Provider.OPENAI, config)}
+    pending = []
+    for entry in from_json(manifest_path.read_bytes()):
+        model_config = configured.get(entry["model_id"]) or ModelConfig(model_id=entry["model_id"])
+        service = get_service(Provider.OPENAI, config, model_config)
+        
+        try:
+            with capture_usage() as usage_records:
+                results = service.collect_batch(entry["batch_id"])
+        except Exception as e:
+            log(f"Batch {entry['batch_id']} could not be collected: {e}")
+            pending.append(entry)
+            continue
+        if results is None:
+            pending.append(entry)
+            continue
+        
+        for doc_id, result in results.items():
+            # Usage records are tagged with the document they belong to
+            doc_records = [r for r in usage_records if r.metadata.get("document_id") == doc_id]
+            pdf_stem = Path(entry["documents"][doc_id]).stem
+            save_result(
+                result,
+                get_output_path(output_dir, Provider.OPENAI, model_config, pdf_stem),
+                Provider.OPENAI,
+                model_config,
+                input_tokens=sum(r.input_tokens for r in doc_records),
+                output_tokens=sum(r.output_tokens for r in doc_records),
+                cost_usd=sum(r.cost_usd for r in doc_records),
+            )
+        log(f"Collected batch {entry['batch_id']}: {len(results)}/{len(entry['documents'])} document(s)")
+    
+    if pending:
+        manifest_path.write_bytes(to_json(pending, indent=2))
+        log(f"{len(pending)} batch(es) still pending")
+    else:
+        manifest_path.unlink()
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction across providers and models.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-evaluate all outputs, even those unchanged since the last evaluation",
+    )
+    parser.add_argument(
+        "--concurrent-pdfs",
+        type=int,
+        default=1,
+        help="Number of PDFs whose extraction runs may overlap (default: 1)",
+    )
+    parser.add_argument(
+        "--openai-batch",
+        choices=["submit", "collect"],
+        help="Run the OpenAI models through the Batch API (half price, up to 24h): "
+        "'submit' queues every input PDF, 'collect' saves finished results and evaluates",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Call the models even when the response cache has an answer (new answers are still cached)",
+    )
+    args = parser.parse_args()
+
     # Reset usage tracker
     reset_tracker()
     
     # Configuration
     config = load_config()
+    if args.refresh_cache:
+        config.providers.bedrock.refresh_response_cache = True
+        config.providers.deepseek.refresh_response_cache = True
     input_dir = Path("input")
     output_dir = Path(config.output.output_dir)
     images_dir = Path(config.output.images_dir) if config.output.save_images else None
@@ -275,42 +607,55 @@ def main():
     # Ensure directories exist
     output_dir.mkdir(exist_ok=True)
     
-    # Find all PDF files
-    pdf_files = list(input_dir.glob("*.pdf"))
-    
-    if not pdf_files:
-        log(f"No PDF files found in {input_dir}")
+    if args.openai_batch == "submit":
+        submit_openai_batches(
+            pdf_files=sorted(input_dir.glob("*.pdf")),
+            output_dir=output_dir,
+            config=config,
+            template_path=template_path if template_path.exists() else None,
+            images_dir=images_dir,
+        )
         return
     
-    log(f"Found {len(pdf_files)} PDF file(s) to process")
-    log("")
-    
-    # Run the benchmark
-    run_benchmark(
-        pdf_files=pdf_files,
-        output_dir=output_dir,
-        config=config,
-        template_path=template_path if template_path.exists() else None,
-        images_dir=images_dir,
-    )
+    if args.openai_batch == "collect":
+        collect_openai_batches(output_dir, config)
+    else:
+        # Count PDF files up front; the paths themselves are streamed lazily
+        pdf_count = count_pdf_files(input_dir)
+        
+        if not pdf_count:
+            log(f"No PDF files found in {input_dir}")
+            return
+        
+        log(f"Found {pdf_count} PDF file(s) to process")
+        log("")
+        
+        # Run the benchmark
+        run_benchmark(
+            pdf_files=input_dir.glob("*.pdf"),
+            output_dir=output_dir,
+            config=config,
+            template_path=template_path if template_path.exists() else None,
+            images_dir=images_dir,
+            pdf_count=pdf_count,
+            max_concurrent_pdfs=args.concurrent_pdfs,
+        )
     
     # Print usage summary
-    log("=" * 70)
+    log(_SEPARATOR)
     log("Benchmark Complete")
-    log("=" * 70)
+    log(_SEPARATOR)
     tracker = get_tracker()
     tracker.print_summary()
 
     # Convert tracker data to usage_data format for evaluation
     # Format: {"{provider}:{model_id}": {"cost": float, "input_tokens": int, "output_tokens": int}}
-    usage_data: dict[str, dict] = {}
+    usage_data: defaultdict[str, dict] = defaultdict(lambda: {"cost": 0.0, "input_tokens": 0, "output_tokens": 0})
     for record in tracker.records:
-        key = f"{record.provider}:{record.model}"
-        if key not in usage_data:
-            usage_data[key] = {"cost": 0.0, "input_tokens": 0, "output_tokens": 0}
-        usage_data[key]["cost"] += record.cost_usd
-        usage_data[key]["input_tokens"] += record.input_tokens
-        usage_data[key]["output_tokens"] += record.output_tokens
+        usage = usage_data[f"{record.provider}:{record.model}"]
+        usage["cost"] += record.cost_usd
+        usage["input_tokens"] += record.input_tokens
+        usage["output_tokens"] += record.output_tokens
 
     # Run automatic evaluation
     run_post_extraction_evaluation(
@@ -319,6 +664,7 @@ def main():
         cache_dir=Path("evaluation_results"),
         usage_data=usage_data,
         quiet=False,
+        force=args.force,
     )
 
 
@@ -5,24 +5,45 @@ A service-based architecture for extracting structured JSON from images
 using various AI providers (AWS Bedrock, DeepSeek + OpenAI).
 """
 
-from .config import Provider, load_config, get_config
-from .services import get_service, JsonExtractionService
-from .schemas import InspectionTemplate
-from .utils import pdf_to_images, log, get_tracker, reset_tracker
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = [
+if TYPE_CHECKING:
+    from .config import Provider, load_config, get_config
+    from .services import get_service, JsonExtractionService
+    from .schemas import InspectionTemplate
+    from .utils import pdf_to_images, log, get_tracker, reset_tracker
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so importing e.g. src.config does not pull in
+# every provider SDK.
+_EXPORTS: dict[str, str] = {
     # Config
-    "Provider",
-    "load_config",
-    "get_config",
+    "Provider": ".config",
+    "load_config": ".config",
+    "get_config": ".config",
     # Services
-    "get_service",
-    "JsonExtractionService",
+    "get_service": ".services",
+    "JsonExtractionService": ".services",
     # Schemas
-    "InspectionTemplate",
+    "InspectionTemplate": ".schemas",
     # Utils
-    "pdf_to_images",
-    "log",
-    "get_tracker",
-    "reset_tracker",
-]
+    "pdf_to_images": ".utils",
+    "log": ".utils",
+    "get_tracker": ".utils",
+    "reset_tracker": ".utils",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -5,10 +5,9 @@ Loads and validates configuration from YAML files.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Annotated, Any, Literal
 
-import yaml  # type: ignore[import-untyped]
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, Field
 
 from .enums import Provider
 
@@ -18,6 +17,12 @@ class ModelConfig(BaseModel):
     model_id: str
     supporting_model_id: str | None = None  # Used by deepseek for JSON extraction model
     max_tokens: int | None = None  # Per-model max tokens (overrides provider default)
+    prompt_caching: bool = False  # Bedrock: cache the static prompt prefix (model must support cachePoint)
+
+
+# A models: key whose entries are all commented out loads as None; treat it
+# as an empty list so a provider can be switched off that way
+_ModelList = Annotated[list[ModelConfig], BeforeValidator(lambda value: [] if value is None else value)]
 
 
 class BedrockConfig(BaseModel):
@@ -27,7 +32,12 @@ class BedrockConfig(BaseModel):
     retries: int = 2
     max_tokens: int = 10000
     chunk_size: int = 2  # Max images per request to avoid payload limits
-    models: list[ModelConfig] = Field(default_factory=list)
+    max_concurrency: int = 4  # Max chunk requests in flight at once
+    image_format: Literal["png", "jpeg", "webp"] = "png"  # jpeg/webp cut upload size
+    max_image_dim: int | None = None  # Downscale pages whose longest side exceeds this
+    response_cache_dir: str | None = None  # Reuse responses for identical requests
+    refresh_response_cache: bool = False  # Call the model even on a cache hit (still stores the answer)
+    models: _ModelList = Field(default_factory=list)
 
 
 class DeepseekConfig(BaseModel):
@@ -35,36 +45,55 @@ class DeepseekConfig(BaseModel):
     # OCR settings
     ocr_timeout: int = 300
     use_grounding: bool = False
+    ocr_concurrency: int = 1  # Pages sent to Ollama at once (match OLLAMA_NUM_PARALLEL)
+    use_text_layer: bool = False  # Use born-digital pages' embedded text instead of OCR
+    ocr_load_timeout: int = 600  # Timeout for loading the OCR model before the first page
+    ocr_keep_alive: str = "30m"  # How long Ollama keeps the OCR model loaded after a request
+    ocr_num_ctx: int | None = None  # Ollama context window for OCR (None = server default)
+    ocr_num_predict: int | None = None  # Max tokens generated per page (None = server default)
 
     # JSON extraction settings
     json_temperature: float = 0.0
+    json_timeout: int = 300  # Per-request timeout for the OpenAI JSON step
+    json_retries: int = 2
+    legend_prepass: bool = False  # Read the legend from page 1 while the other pages are OCR'd
+
+    response_cache_dir: str | None = None  # Reuse page OCR text and JSON for identical requests
+    refresh_response_cache: bool = False  # Call the models even on a cache hit (still stores the answers)
 
     # Model configurations
-    models: list[ModelConfig] = Field(default_factory=list)
+    models: _ModelList = Field(default_factory=list)
 
 
 class GoogleConfig(BaseModel):
     """Configuration for Google AI provider (Gemini models)."""
     timeout: int = 300
+    retries: int = 2  # Retries with backoff on timeouts, rate limits and server errors
     max_output_tokens: int = 65536
     thinking_level: str = "low"  # minimal, low, medium, high
     chunk_size: int = 2  # Max images per request to avoid payload limits
-    models: list[ModelConfig] = Field(default_factory=list)
+    max_concurrency: int = 4  # Max chunk requests in flight at once
+    models: _ModelList = Field(default_factory=list)
 
 
 class AnthropicConfig(BaseModel):
     """Configuration for Anthropic provider (Claude models)."""
     timeout: int = 300
+    retries: int = 2  # Retries with backoff on timeouts, rate limits and server errors
     max_tokens: int = 8192
-    models: list[ModelConfig] = Field(default_factory=list)
+    cache_control: bool = True  # Cache the static extraction prompt across requests
+    max_image_dim: int | None = 1568  # Longest side Claude uses before downscaling itself
+    models: _ModelList = Field(default_factory=list)
 
 
 class OpenAIConfig(BaseModel):
     """Configuration for OpenAI provider (GPT models)."""
     timeout: int = 300
+    retries: int = 2  # Retries with backoff on timeouts, rate limits and server errors
     max_tokens: int = 50000
     chunk_size: int = 2  # Max images per request to avoid payload limits
-    models: list[ModelConfig] = Field(default_factory=list)
+    max_concurrency: int = 4  # Max chunk requests in flight at once
+    models: _ModelList = Field(default_factory=list)
 
 
 class OutputConfig(BaseModel):
@@ -72,6 +101,8 @@ class OutputConfig(BaseModel):
     save_images: bool = True
     images_dir: str = "img"
     output_dir: str = "output"
+    page_cache_dir: str = ".cache/pages"
+    page_dpi: int = 144  # Render resolution for PDF pages (lower = faster, smaller requests)
 
 
 class ProviderConfig(BaseModel):
@@ -94,13 +125,6 @@ class AppConfig(BaseModel):
 _config_holder: dict[str, Any] = {"config": None}
 
 
-def _parse_models(models_data: list[dict] | None) -> list[ModelConfig]:
-    """Parse a list of model configurations."""
-    if not models_data:
-        return []
-    return [ModelConfig(**m) for m in models_data]
-
-
 def load_config(config_path: str | Path | None = None) -> AppConfig:
     """
     Load configuration from a YAML file.
@@ -122,6 +146,9 @@ def load_config(config_path: str | Path | None = None) -> AppConfig:
         _config_holder["config"] = config
         return config
     
+    # yaml is only needed when there is a file to parse
+    import yaml  # type: ignore[import-untyped]
+    
     with open(config_path, "r", encoding="utf-8") as f:
         raw_config = yaml.safe_load(f)
     
@@ -130,54 +157,9 @@ def load_config(config_path: str | Path | None = None) -> AppConfig:
         _config_holder["config"] = config
         return config
     
-    # Parse providers
-    providers_data = raw_config.get("providers", {})
-    
-    # Parse bedrock config
-    bedrock_data = providers_data.get("bedrock", {})
-    bedrock_models = _parse_models(bedrock_data.pop("models", None))
-    bedrock = BedrockConfig(**bedrock_data, models=bedrock_models)
-    
-    # Parse deepseek config
-    deepseek_data = providers_data.get("deepseek", {})
-    deepseek_models = _parse_models(deepseek_data.pop("models", None))
-    deepseek = DeepseekConfig(**deepseek_data, models=deepseek_models)
-
-    # Parse google config
-    google_data = providers_data.get("google", {})
-    google_models = _parse_models(google_data.pop("models", None))
-    google = GoogleConfig(**google_data, models=google_models)
-
-    # Parse anthropic config
-    anthropic_data = providers_data.get("anthropic", {})
-    anthropic_models = _parse_models(anthropic_data.pop("models", None))
-    anthropic = AnthropicConfig(**anthropic_data, models=anthropic_models)
-
-    # Parse openai config
-    openai_data = providers_data.get("openai", {})
-    openai_models = _parse_models(openai_data.pop("models", None))
-    openai_config = OpenAIConfig(**openai_data, models=openai_models)
-
-    providers = ProviderConfig(
-        bedrock=bedrock,
-        deepseek=deepseek,
-        google=google,
-        anthropic=anthropic,
-        openai=openai_config,
-    )
-    
-    # Parse output config
-    output = OutputConfig(**raw_config.get("output", {}))
-    
-    # Parse default provider
-    default_provider_str = raw_config.get("default_provider", "bedrock")
-    default_provider = Provider(default_provider_str)
-    
-    config = AppConfig(
-        default_provider=default_provider,
-        providers=providers,
-        output=output,
-    )
+    # One validation pass over the whole nested tree; sections and fields
+    # missing from the file fall back to the model defaults
+    config = AppConfig.model_validate(raw_config)
     _config_holder["config"] = config
     
     return config
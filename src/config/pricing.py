@@ -2,7 +2,9 @@
 Model Pricing Configuration.
 
 Pricing data for all supported providers and models.
-Prices are per million tokens (input and output).
+Prices are per million tokens (input and output). Models with prompt caching
+may also list "cache_read" and "cache_write" prices; where they are missing,
+cached input is billed at the normal input price.
 """
 
 # Pricing per million tokens (USD)
@@ -19,26 +21,43 @@ PRICING_PER_MILLION: dict[str, dict[str, dict[str, float]]] = {
         "gemini-3-flash-preview": {"input": 0.30, "output": 2.50},
     },
     "bedrock": {
-        "amazon.nova-pro-v1:0": {"input": 0.80, "output": 3.20},
+        # Nova cache reads are 75% off; cache writes cost the normal input price
+        "amazon.nova-pro-v1:0": {"input": 0.80, "output": 3.20, "cache_read": 0.20},
         "qwen.qwen3-vl-235b-a22b": {"input": 0.18, "output": 0.54},
         "google.gemma-3-27b-it": {"input": 0.15, "output": 0.60},
         "nvidia.nemotron-nano-12b-v2": {"input": 0.06, "output": 0.24},
     },
     "anthropic": {
-        "claude-sonnet-4-5-20250929": {"input": 3.00, "output": 15.00},
-        "claude-haiku-4-5-20251001": {"input": 0.80, "output": 4.00},
+        # Cache reads bill at 0.1x input, 5-minute cache writes at 1.25x
+        "claude-sonnet-4-5-20250929": {"input": 3.00, "output": 15.00, "cache_read": 0.30, "cache_write": 3.75},
+        "claude-haiku-4-5-20251001": {"input": 0.80, "output": 4.00, "cache_read": 0.08, "cache_write": 1.00},
     },
     "deepseek": {
         "deepseek-ocr": {"input": 0.0, "output": 0.0},  # Local Ollama - free
     },
 }
 
+# (provider, model) -> (input, output, cache read, cache write) rates,
+# flattened once so each cost lookup is a single dict hit
+_RATES: dict[tuple[str, str], tuple[float, float, float, float]] = {
+    (provider, model): (
+        prices["input"],
+        prices["output"],
+        prices.get("cache_read", prices["input"]),
+        prices.get("cache_write", prices["input"]),
+    )
+    for provider, models in PRICING_PER_MILLION.items()
+    for model, prices in models.items()
+}
+
 
 def calculate_cost(
     provider: str,
     model: str,
     input_tokens: int,
     output_tokens: int,
+    cached_input_tokens: int = 0,
+    cache_write_input_tokens: int = 0,
 ) -> float:
     """
     Calculate cost in USD based on token usage.
@@ -46,18 +65,26 @@ def calculate_cost(
     Args:
         provider: Provider name (e.g., "openai", "google", "bedrock")
         model: Model identifier (e.g., "gpt-5", "gemini-2.5-flash")
-        input_tokens: Number of input tokens
+        input_tokens: Number of input tokens, including cached ones
         output_tokens: Number of output tokens
+        cached_input_tokens: Part of input_tokens read from the prompt cache
+        cache_write_input_tokens: Part of input_tokens written to the prompt cache
 
     Returns:
         Cost in USD. Returns 0.0 if provider/model not found.
     """
-    pricing = PRICING_PER_MILLION.get(provider, {}).get(model)
-    if not pricing:
+    rates = _RATES.get((provider, model))
+    if rates is None:
         return 0.0  # Unknown model, return 0
 
-    input_cost = (input_tokens / 1_000_000) * pricing["input"]
-    output_cost = (output_tokens / 1_000_000) * pricing["output"]
+    input_rate, output_rate, cache_read_rate, cache_write_rate = rates
+    uncached_tokens = input_tokens - cached_input_tokens - cache_write_input_tokens
+    input_cost = (
+        uncached_tokens * input_rate
+        + cached_input_tokens * cache_read_rate
+        + cache_write_input_tokens * cache_write_rate
+    ) / 1_000_000
+    output_cost = (output_tokens / 1_000_000) * output_rate
     return input_cost + output_cost
 
 
@@ -70,6 +97,7 @@ def get_pricing(provider: str, model: str) -> dict[str, float] | None:
         model: Model identifier
 
     Returns:
-        Dict with "input" and "output" prices per million tokens, or None if not found.
+        Dict with "input" and "output" (and optional "cache_read"/"cache_write")
+        prices per million tokens, or None if not found.
     """
     return PRICING_PER_MILLION.get(provider, {}).get(model)
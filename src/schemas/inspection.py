@@ -175,13 +175,23 @@ def validate_template_lenient(data: dict) -> dict:
     This is used for LLM outputs that may include additional metadata.
     Returns the validated data dict (not a Pydantic model).
     """
-    # Remove any metadata fields before validation
-    clean_data = {k: v for k, v in data.items() if not k.startswith("_")}
+    # Remove any metadata fields before validation (copying only if there are any)
+    if any(k.startswith("_") for k in data):
+        clean_data = {k: v for k, v in data.items() if not k.startswith("_")}
+    else:
+        clean_data = data
     
     try:
         # Try strict validation first
         template = InspectionTemplate.model_validate(clean_data)
         return template.model_dump()
-    except Exception as e:
-        log(f"Strict validation failed, returning raw data: {e}")
+    except ValidationError as e:
+        # Report only the count and first error; rendering the whole error
+        # tree gets expensive on large, badly-formed outputs
+        first = e.errors(include_url=False, include_input=False)[0]
+        location = ".".join(str(part) for part in first["loc"])
+        log(
+            f"Strict validation failed with {e.error_count()} error(s), returning raw data "
+            f"(first: {location}: {first['msg']})"
+        )
         return clean_data
\ No newline at end of file
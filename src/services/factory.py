@@ -9,7 +9,7 @@ from src.config import Provider, get_config
 from src.config.loader import AppConfig, ModelConfig
 
 from .base import JsonExtractionService
-from .providers import AnthropicService, BedrockService, DeepseekService, GoogleService, OpenAIService
+from . import providers
 
 
 def get_service(
@@ -42,29 +42,30 @@ def get_service(
     if provider is None:
         provider = config.default_provider
     
+    # Provider modules load on first use, so only the selected SDK is imported
     match provider:
         case Provider.BEDROCK:
-            return BedrockService(
+            return providers.BedrockService(
                 config=config.providers.bedrock,
                 model_config=model_config,
             )
         case Provider.DEEPSEEK:
-            return DeepseekService(
+            return providers.DeepseekService(
                 config=config.providers.deepseek,
                 model_config=model_config,
             )
         case Provider.GOOGLE:
-            return GoogleService(
+            return providers.GoogleService(
                 config=config.providers.google,
                 model_config=model_config,
             )
         case Provider.ANTHROPIC:
-            return AnthropicService(
+            return providers.AnthropicService(
                 config=config.providers.anthropic,
                 model_config=model_config,
             )
         case Provider.OPENAI:
-            return OpenAIService(
+            return providers.OpenAIService(
                 config=config.providers.openai,
                 model_config=model_config,
             )
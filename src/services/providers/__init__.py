@@ -1,18 +1,38 @@
 """
 Provider implementations for JSON extraction services.
+
+Each provider module (and its SDK) is imported on first access, so using one
+provider does not load the others.
 """
 
-from .anthropic import AnthropicService
-from .bedrock import BedrockService
-from .deepseek import DeepseekService
-from .google import GoogleService
-from .openai import OpenAIService
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .anthropic import AnthropicService
+    from .bedrock import BedrockService
+    from .deepseek import DeepseekService
+    from .google import GoogleService
+    from .openai import OpenAIService
+
+_EXPORTS: dict[str, str] = {
+    "AnthropicService": ".anthropic",
+    "BedrockService": ".bedrock",
+    "DeepseekService": ".deepseek",
+    "GoogleService": ".google",
+    "OpenAIService": ".openai",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
 
-__all__ = [
-    "AnthropicService",
-    "BedrockService",
-    "DeepseekService",
-    "GoogleService",
-    "OpenAIService",
-]
 
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -12,8 +12,9 @@ Reference: https://platform.claude.com/docs/en/build-with-claude/structured-outp
 
 import base64
 import io
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Any, TypeVar
 
 import anthropic
@@ -21,14 +22,15 @@ from anthropic import transform_schema
 from dotenv import load_dotenv
 from PIL import Image
 from pydantic import BaseModel
+from pydantic_core import from_json
 
 from src.config.loader import AnthropicConfig, ModelConfig
-from src.schemas.inspection import (
-    MaintenanceCategory,
-    WorkOrderSubCategory,
+from src.utils.enums import (
+    MAINTENANCE_CATEGORIES_JSON,
+    WORK_ORDER_SUBCATEGORIES_JSON,
+    normalize_enum_values,
 )
-from src.services.providers.bedrock import normalize_enum_values
-from src.utils.prompts import VISION_EXTRACTION_PROMPT_ANTHROPIC
+from src.utils.prompts import VISION_EXTRACTION_PROMPT_ANTHROPIC, render_template_context
 from src.utils.logger import log, log_usage
 
 # Load environment variables from .env file
@@ -40,6 +42,77 @@ T = TypeVar("T", bound=BaseModel)
 STRUCTURED_OUTPUTS_BETA = "structured-outputs-2025-11-13"
 
 
+@lru_cache(maxsize=4)
+def _anthropic_client(api_key: str, timeout: int, retries: int) -> anthropic.Anthropic:
+    """
+    Create an Anthropic client, cached per key, timeout and retry count.
+
+    get_service builds a new service for every PDF/model run; sharing the
+    client lets those runs reuse one connection pool.
+    """
+    return anthropic.Anthropic(api_key=api_key, timeout=timeout, max_retries=retries)
+
+
+@lru_cache(maxsize=8)
+def _structured_output_schema(schema: type[BaseModel]) -> dict[str, Any]:
+    """
+    Transform a Pydantic model into an Anthropic structured-outputs schema.
+
+    The result depends only on the model class, so it is built once per class
+    and reused across requests. Callers must not mutate the returned dict.
+
+    Args:
+        schema: Pydantic model class
+
+    Returns:
+        JSON schema dict accepted by output_format
+    """
+    return transform_schema(schema)
+
+
+@lru_cache(maxsize=32)
+def _build_prompt(template_context: str) -> str:
+    """Build the extraction prompt (cached per rendered template context)."""
+    return VISION_EXTRACTION_PROMPT_ANTHROPIC.format(
+        template_context=template_context,
+        maintenance_categories=MAINTENANCE_CATEGORIES_JSON,
+        work_order_subcategories=WORK_ORDER_SUBCATEGORIES_JSON,
+    )
+
+
+def _image_block(img: Image.Image, max_dim: int | None = None) -> dict[str, Any]:
+    """
+    Encode a page image as an Anthropic base64 image content block.
+
+    Args:
+        img: PIL Image to encode (never modified; pages are shared across requests)
+        max_dim: Optional cap on the longest side, applied before encoding
+
+    Returns:
+        Image content block for the messages API
+    """
+    # Claude downsamples larger images itself, so extra pixels only cost
+    # encode time and upload size
+    if max_dim and max(img.size) > max_dim:
+        img = img.copy()
+        img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    # Encode straight from the buffer's memory; only the base64 text is kept
+    image_base64 = base64.b64encode(buffer.getbuffer()).decode("ascii")
+
+    # Anthropic expects images in this format
+    return {
+        "type": "image",
+        "source": {
+            "type": "base64",
+            "media_type": "image/png",
+            "data": image_base64,
+        },
+    }
+
+
 class AnthropicError(Exception):
     """Base exception for Anthropic-related errors."""
 
@@ -96,10 +169,7 @@ class AnthropicService:
                 )
 
             try:
-                self._client = anthropic.Anthropic(
-                    api_key=api_key,
-                    timeout=self.config.timeout,
-                )
+                self._client = _anthropic_client(api_key, self.config.timeout, self.config.retries)
             except Exception as e:
                 raise AnthropicConnectionError(
                     f"Failed to create Anthropic client: {e}"
@@ -131,43 +201,33 @@ class AnthropicService:
 
         client = self._get_client()
 
-        # Get enum values as strings for the prompt
-        maintenance_categories = [cat.value for cat in MaintenanceCategory]
-        work_order_subcategories = [sub.value for sub in WorkOrderSubCategory]
-
         # Build the prompt - schema is enforced by output_format, so prompt focuses on extraction rules
-        prompt = VISION_EXTRACTION_PROMPT_ANTHROPIC.format(
-            template_context=json.dumps(context, indent=2) if context else "N/A",
-            maintenance_categories=json.dumps(maintenance_categories, indent=2),
-            work_order_subcategories=json.dumps(work_order_subcategories, indent=2),
-        )
+        prompt = _build_prompt(render_template_context(context))
 
-        # Build content parts: images first, then text prompt (Anthropic convention)
+        # Build content parts: images first; the prompt follows them, or moves to
+        # the system block when cache control is on (see below)
         content: list[dict[str, Any]] = []
 
-        for i, img in enumerate(images):
-            log(f"Adding image {i + 1}/{len(images)} to request...")
-            buffer = io.BytesIO()
-            img.save(buffer, format="PNG")
-            image_bytes = buffer.getvalue()
-            image_base64 = base64.b64encode(image_bytes).decode("utf-8")
-
-            # Anthropic expects images in this format
-            content.append({
-                "type": "image",
-                "source": {
-                    "type": "base64",
-                    "media_type": "image/png",
-                    "data": image_base64,
-                },
-            })
-
-        # Add the text prompt after images
-        content.append({"type": "text", "text": prompt})
+        # PNG compression releases the GIL, so pages are encoded in parallel;
+        # map() keeps them in page order
+        log(f"Encoding {len(images)} image(s) for request...")
+        max_workers = max(1, min(len(images), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="anthropic-encode") as executor:
+            content.extend(executor.map(partial(_image_block, max_dim=self.config.max_image_dim), images))
+
+        # The extraction prompt is identical for every document, so with cache
+        # control it goes in a cached system block (the cache covers the request
+        # prefix, which images would otherwise break); without it, it follows
+        # the images as before
+        system: list[dict[str, Any]] | anthropic.Omit = anthropic.omit
+        if self.config.cache_control:
+            system = [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+        else:
+            content.append({"type": "text", "text": prompt})
 
         # Transform Pydantic schema for Anthropic structured outputs
         # This handles unsupported features by adding constraints to field descriptions
-        transformed_schema = transform_schema(schema)
+        transformed_schema = _structured_output_schema(schema)
         log(f"Using structured outputs with schema: {schema.__name__}")
 
         # Send request to Anthropic using beta API with structured outputs
@@ -177,6 +237,7 @@ class AnthropicService:
                 model=self.model_id,
                 max_tokens=self.config.max_tokens,
                 betas=[STRUCTURED_OUTPUTS_BETA],
+                system=system,
                 messages=[{"role": "user", "content": content}],
                 output_format={
                     "type": "json_schema",
@@ -202,9 +263,13 @@ class AnthropicService:
                     "Increase max_tokens in config."
                 )
 
-        # Log usage
+        # Log usage. With cache_control on, input_tokens excludes the prompt
+        # tokens read from or written to the cache, so those are added back
+        # to get the full input (and priced at their own rates)
         if hasattr(response, "usage") and response.usage:
-            input_tokens = response.usage.input_tokens
+            cache_read_tokens = getattr(response.usage, "cache_read_input_tokens", None) or 0
+            cache_write_tokens = getattr(response.usage, "cache_creation_input_tokens", None) or 0
+            input_tokens = response.usage.input_tokens + cache_read_tokens + cache_write_tokens
             output_tokens = response.usage.output_tokens
 
             log_usage(
@@ -212,6 +277,8 @@ class AnthropicService:
                 model=self.model_id,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
+                cached_input_tokens=cache_read_tokens,
+                cache_write_input_tokens=cache_write_tokens,
                 operation="image_to_json_extraction",
             )
 
@@ -226,8 +293,8 @@ class AnthropicService:
 
         # Parse JSON - should always be valid due to structured outputs
         try:
-            result_dict = json.loads(result_text)
-        except json.JSONDecodeError as e:
+            result_dict = from_json(result_text)
+        except ValueError as e:
             log(f"Failed to parse JSON response: {e}")
             log(f"Response text: {result_text[:2000]}...")
             raise AnthropicModelError(f"Invalid JSON in response: {e}") from e
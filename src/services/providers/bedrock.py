@@ -5,26 +5,34 @@ Uses AWS Bedrock vision models (e.g., Qwen3 VL) to extract structured JSON
 directly from images in a single LLM request.
 """
 
+import contextvars
 import io
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, TypeVar
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 from PIL import Image
 from pydantic import BaseModel
+from pydantic_core import from_json
 
 from src.config.loader import BedrockConfig, ModelConfig
-from src.schemas.inspection import (
-    MaintenanceCategory, 
-    WorkOrderSubCategory,
+from src.utils.cache import ResponseCache, cache_key
+from src.utils.enums import (
+    MAINTENANCE_CATEGORIES_JSON,
+    WORK_ORDER_SUBCATEGORIES_JSON,
+    normalize_enum_values,
 )
 from src.utils.logger import log, log_usage
 from src.utils.merge import merge_section_responses
-from src.utils.prompts import VISION_EXTRACTION_PROMPT, VISION_EXTRACTION_PROMPT_CONTINUATION
+from src.utils.prompts import (
+    VISION_EXTRACTION_PROMPT,
+    VISION_EXTRACTION_PROMPT_CONTINUATION,
+    render_template_context,
+)
 
 # Load environment variables from .env file
 load_dotenv()
@@ -32,36 +40,80 @@ load_dotenv()
 T = TypeVar("T", bound=BaseModel)
 
 
-def normalize_enum_values(obj: Any) -> Any:
+@lru_cache(maxsize=8)
+def _schema_json(schema: type[BaseModel]) -> str:
+    """Get the indented JSON schema text for a model class (cached per class)."""
+    return json.dumps(schema.model_json_schema(), indent=2)
+
+
+@lru_cache(maxsize=32)
+def _build_prompt(schema: type[BaseModel], template_context: str) -> str:
+    """Build the first-chunk extraction prompt (cached per schema and context text)."""
+    return VISION_EXTRACTION_PROMPT.format(
+        json_schema=_schema_json(schema),
+        template_context=template_context,
+        maintenance_categories=MAINTENANCE_CATEGORIES_JSON,
+        work_order_subcategories=WORK_ORDER_SUBCATEGORIES_JSON,
+    )
+
+
+def _encode_image(img: Image.Image, image_format: str = "png", max_dim: int | None = None) -> bytes:
+    """
+    Encode a page image for a Converse image block.
+    
+    PNG uses zlib level 1, which is several times cheaper to encode than the
+    default and, for flat form pages, produces payloads about the same size.
+    JPEG (quality 85) is faster still and much smaller for photographed scans.
+    WebP (quality 80, fastest method) costs about the same as PNG to encode
+    but is roughly a third smaller on form pages.
+    
+    Args:
+        img: Page image (never modified; pages are shared across requests)
+        image_format: "png", "jpeg" or "webp"
+        max_dim: Optional cap on the longest side, applied before encoding
+        
+    Returns:
+        Encoded image bytes
+    """
+    if max_dim and max(img.size) > max_dim:
+        img = img.copy()
+        img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+    
+    buffer = io.BytesIO()
+    if image_format == "jpeg":
+        img.convert("RGB").save(buffer, format="JPEG", quality=85, optimize=False)
+    elif image_format == "webp":
+        img.convert("RGB").save(buffer, format="WEBP", quality=80, method=0)
+    else:
+        img.save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=8)
+def _bedrock_client(profile: str | None, region: str, timeout: int, retries: int):
     """
-    Recursively normalize enum field values to uppercase with underscores.
+    Create a bedrock-runtime client, cached per connection settings.
     
-    Fixes common LLM mistakes like:
-    - 'RATING_TYPE-select' -> 'RATING_TYPE_SELECT'
-    - 'WORK_ORDER_SUB_CATEGORY_CARPENTRY_FLOORBOARD_REpair' -> 'WORK_ORDER_SUB_CATEGORY_CARPENTRY_FLOORBOARD_REPAIR'
+    A new service is built for every PDF/model run; sharing the client skips
+    re-loading the botocore service model and keeps its connection pool warm.
+    boto3 clients are thread-safe, so concurrent runs can share one.
     """
-    # Fields that contain enum values needing normalization
-    ENUM_FIELDS = {
-        "rating_type",
-        "work_order_category",
-        "work_order_sub_category",
-        "display_type",
-    }
+    import boto3
+    from botocore.config import Config
     
-    if isinstance(obj, dict):
-        result = {}
-        for key, value in obj.items():
-            if key in ENUM_FIELDS and isinstance(value, str):
-                # Normalize: replace hyphens with underscores, uppercase everything
-                result[key] = value.replace("-", "_").upper()
-            elif isinstance(value, (dict, list)):
-                result[key] = normalize_enum_values(value)
-            else:
-                result[key] = value
-        return result
-    elif isinstance(obj, list):
-        return [normalize_enum_values(item) if isinstance(item, (dict, list)) else item for item in obj]
-    return obj
+    bedrock_config = Config(
+        read_timeout=timeout,
+        connect_timeout=30,
+        # Adaptive mode backs off on throttling and rate-limits the shared
+        # client, which matters once chunks and PDFs are sent concurrently
+        retries={"max_attempts": retries, "mode": "adaptive"}
+    )
+    session = boto3.Session(profile_name=profile)
+    return session.client(
+        "bedrock-runtime",
+        region_name=region,
+        config=bedrock_config
+    )
 
 
 class BedrockError(Exception):
@@ -110,6 +162,10 @@ class BedrockService:
             self.model_id = "qwen.qwen3-vl-235b-a22b"
         
         self._client = None
+        self._response_cache = (
+            ResponseCache(self.config.response_cache_dir, refresh=self.config.refresh_response_cache)
+            if self.config.response_cache_dir else None
+        )
     
     def _get_max_tokens(self) -> int:
         """Get max tokens, preferring per-model config over provider default."""
@@ -117,25 +173,18 @@ class BedrockService:
             return self._model_config.max_tokens
         return self.config.max_tokens
     
+    def _prompt_caching_enabled(self) -> bool:
+        """Check whether the configured model should use Bedrock prompt caching."""
+        return self._model_config is not None and self._model_config.prompt_caching
+    
     def _get_client(self):
-        """Get or create the Bedrock client."""
+        """Get or create the Bedrock client (shared by services with the same settings)."""
         if self._client is None:
             profile = os.getenv("AWS_PROFILE")
             region = os.getenv("AWS_REGION", self.config.region)
             
-            bedrock_config = Config(
-                read_timeout=self.config.timeout,
-                connect_timeout=30,
-                retries={"max_attempts": self.config.retries}
-            )
-            
             try:
-                session = boto3.Session(profile_name=profile)
-                self._client = session.client(
-                    "bedrock-runtime",
-                    region_name=region,
-                    config=bedrock_config
-                )
+                self._client = _bedrock_client(profile, region, self.config.timeout, self.config.retries)
             except Exception as e:
                 raise BedrockConnectionError(f"Failed to create Bedrock client: {e}") from e
         
@@ -166,12 +215,15 @@ class BedrockService:
         
         log(f"Extracting JSON from {total_images} image(s) using Bedrock [{self.model_id}]")
         
+        # Render the template context once for every chunk's prompt
+        template_context = render_template_context(context)
+        
         # If images fit in a single chunk, process directly
         if total_images <= chunk_size:
             return self._generate_json_chunk(
                 images=images,
                 schema=schema,
-                context=context,
+                template_context=template_context,
                 chunk_info=None,  # No chunking info needed
             )
         
@@ -185,33 +237,49 @@ class BedrockService:
         total_chunks = len(chunks)
         log(f"Split into {total_chunks} chunks")
         
-        # Process each chunk
-        chunk_responses: list[dict] = []
-        current_page = 1
+        # Create the shared client up front so worker threads don't race to build it
+        self._get_client()
         
-        for chunk_idx, chunk_images in enumerate(chunks):
-            chunk_number = chunk_idx + 1
-            page_start = current_page
-            page_end = current_page + len(chunk_images) - 1
-            
-            log(f"Processing chunk {chunk_number}/{total_chunks} (pages {page_start}-{page_end})...")
+        # Process chunks concurrently; each request is network-bound and
+        # independent, and results are collected back in page order
+        max_workers = max(1, min(self.config.max_concurrency, total_chunks))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bedrock-chunk") as executor:
+            futures = []
+            current_page = 1
             
-            chunk_info = {
-                "chunk_number": chunk_number,
-                "total_chunks": total_chunks,
-                "page_start": page_start,
-                "page_end": page_end,
-                "total_pages": total_images,
-            }
+            for chunk_idx, chunk_images in enumerate(chunks):
+                chunk_number = chunk_idx + 1
+                page_start = current_page
+                page_end = current_page + len(chunk_images) - 1
+                
+                log(f"Processing chunk {chunk_number}/{total_chunks} (pages {page_start}-{page_end})...")
+                
+                chunk_info = {
+                    "chunk_number": chunk_number,
+                    "total_chunks": total_chunks,
+                    "page_start": page_start,
+                    "page_end": page_end,
+                    "total_pages": total_images,
+                }
+                
+                # Run in a copy of the caller's context so usage capture still applies
+                futures.append(executor.submit(
+                    contextvars.copy_context().run,
+                    self._generate_json_chunk,
+                    images=chunk_images,
+                    schema=schema,
+                    template_context=template_context,
+                    chunk_info=chunk_info,
+                ))
+                current_page = page_end + 1
             
-            chunk_result = self._generate_json_chunk(
-                images=chunk_images,
-                schema=schema,
-                context=context,
-                chunk_info=chunk_info,
-            )
-            chunk_responses.append(chunk_result)
-            current_page = page_end + 1
+            try:
+                chunk_responses: list[dict] = [future.result() for future in futures]
+            except Exception:
+                # Don't send the remaining chunks once one has failed
+                for future in futures:
+                    future.cancel()
+                raise
         
         # Merge all chunk responses
         log(f"Merging {len(chunk_responses)} chunk responses...")
@@ -224,7 +292,7 @@ class BedrockService:
         self,
         images: list[Image.Image],
         schema: type[T],
-        context: dict | None = None,
+        template_context: str = "N/A",
         chunk_info: dict | None = None,
     ) -> dict:
         """
@@ -233,7 +301,7 @@ class BedrockService:
         Args:
             images: List of PIL Images for this chunk
             schema: Pydantic model class for the output schema
-            context: Optional template dictionary for additional context
+            template_context: Template context already rendered as prompt text
             chunk_info: Optional dict with chunk_number, total_chunks, page_start, 
                        page_end, total_pages for continuation prompts
             
@@ -242,13 +310,6 @@ class BedrockService:
         """
         client = self._get_client()
         
-        # Generate JSON schema from Pydantic model
-        json_schema = schema.model_json_schema()
-        
-        # Get enum values as strings for the prompt
-        maintenance_categories = [cat.value for cat in MaintenanceCategory]
-        work_order_subcategories = [sub.value for sub in WorkOrderSubCategory]
-        
         # Build the prompt - use continuation prompt for chunk 2+
         if chunk_info and chunk_info["chunk_number"] > 1:
             prompt = VISION_EXTRACTION_PROMPT_CONTINUATION.format(
@@ -257,21 +318,20 @@ class BedrockService:
                 page_start=chunk_info["page_start"],
                 page_end=chunk_info["page_end"],
                 total_pages=chunk_info["total_pages"],
-                json_schema=json.dumps(json_schema, indent=2),
-                template_context=json.dumps(context, indent=2) if context else "N/A",
-                maintenance_categories=json.dumps(maintenance_categories, indent=2),
-                work_order_subcategories=json.dumps(work_order_subcategories, indent=2),
+                json_schema=_schema_json(schema),
+                template_context=template_context,
+                maintenance_categories=MAINTENANCE_CATEGORIES_JSON,
+                work_order_subcategories=WORK_ORDER_SUBCATEGORIES_JSON,
             )
         else:
-            prompt = VISION_EXTRACTION_PROMPT.format(
-                json_schema=json.dumps(json_schema, indent=2),
-                template_context=json.dumps(context, indent=2) if context else "N/A",
-                maintenance_categories=json.dumps(maintenance_categories, indent=2),
-                work_order_subcategories=json.dumps(work_order_subcategories, indent=2),
-            )
+            prompt = _build_prompt(schema, template_context)
         
-        # Build content blocks: text prompt first, then all images
+        # Build content blocks: text prompt first, then all images. The prompt
+        # (rules, schema, template context) is identical across documents, so
+        # models that support it get a cache point right after it
         content: list[dict] = [{"text": prompt}]
+        if self._prompt_caching_enabled():
+            content.append({"cachePoint": {"type": "default"}})
         
         # Track total request size for validation
         prompt_size_bytes = len(prompt.encode('utf-8'))
@@ -281,9 +341,7 @@ class BedrockService:
         
         for i, img in enumerate(images):
             log(f"Adding image {i + 1}/{len(images)} to request...")
-            buffer = io.BytesIO()
-            img.save(buffer, format="PNG")
-            image_bytes = buffer.getvalue()
+            image_bytes = _encode_image(img, self.config.image_format, self.config.max_image_dim)
             image_size_mb = len(image_bytes) / (1024 * 1024)
             
             # Check individual image size limit
@@ -298,7 +356,7 @@ class BedrockService:
             
             content.append({
                 "image": {
-                    "format": "png",
+                    "format": self.config.image_format,
                     "source": {"bytes": image_bytes}
                 }
             })
@@ -320,6 +378,22 @@ class BedrockService:
                 f"Consider splitting the document into smaller batches or reducing image resolution."
             )
         
+        # Identical requests (same model, limits, prompt and page images) get
+        # the stored response instead of another model call
+        response_key = None
+        if self._response_cache is not None:
+            response_key = cache_key(
+                self.model_id.encode(),
+                str(self._get_max_tokens()).encode(),
+                prompt.encode(),
+                *(block["image"]["source"]["bytes"] for block in content if "image" in block),
+            )
+            cached = self._response_cache.get(response_key)
+            if cached is not None:
+                log(f"Using cached response {response_key[:12]}")
+                cached.replay_usage()
+                return normalize_enum_values(from_json(cached.text))
+        
         # Send request to Bedrock
         try:
             log("Sending request to Bedrock...")
@@ -339,17 +413,22 @@ class BedrockService:
             log(f"Unexpected error calling Bedrock: {e}")
             raise BedrockError(f"Unexpected error calling Bedrock: {e}") from e
         
-        # Log usage
+        # Log usage. Converse's inputTokens excludes prompt tokens read from or
+        # written to the cache, so they are added back for the full input
         usage = response.get("usage", {})
-        input_tokens = usage.get("inputTokens", 0)
+        cache_read_tokens = usage.get("cacheReadInputTokens", 0)
+        cache_write_tokens = usage.get("cacheWriteInputTokens", 0)
+        input_tokens = usage.get("inputTokens", 0) + cache_read_tokens + cache_write_tokens
         output_tokens = usage.get("outputTokens", 0)
         
-        log_usage(
+        usage_record = log_usage(
             provider="bedrock",
             model=self.model_id,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
-            operation="image_to_json_extraction"
+            cached_input_tokens=cache_read_tokens,
+            cache_write_input_tokens=cache_write_tokens,
+            operation="image_to_json_extraction",
         )
         
         # Extract response text
@@ -361,23 +440,21 @@ class BedrockService:
             raise BedrockModelError(f"Invalid response structure from Bedrock: {e}") from e
         
         # Parse JSON from response (handle markdown code blocks)
-        result_text = result_text.strip()
-        if result_text.startswith("```json"):
-            result_text = result_text[7:]
-        if result_text.startswith("```"):
-            result_text = result_text[3:]
-        if result_text.endswith("```"):
-            result_text = result_text[:-3]
-        result_text = result_text.strip()
+        # (removeprefix/removesuffix return the string itself when there is no fence)
+        result_text = result_text.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
         
         # Validate against Pydantic model
         try:
-            result_dict = json.loads(result_text)
-        except json.JSONDecodeError as e:
+            result_dict = from_json(result_text)
+        except ValueError as e:
             log(f"Failed to parse JSON response: {e}")
             log(f"Response text: {result_text[:2000]}...")
             raise BedrockModelError(f"Invalid JSON in response: {e}") from e
         
+        # Only responses that parsed are worth replaying
+        if response_key is not None:
+            self._response_cache.put(response_key, result_text, usage=[usage_record])
+        
         # Normalize enum values to fix casing issues from LLM
         result_dict = normalize_enum_values(result_dict)
         
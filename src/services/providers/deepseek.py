@@ -6,11 +6,17 @@ Two-step pipeline:
 2. JSON extraction using OpenAI to convert OCR text to structured data
 """
 
-import json
+import contextvars
+import io
 import os
-import tempfile
-from pathlib import Path
-from typing import TypeVar
+import re
+import statistics
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, TypeVar
 
 import httpx
 import ollama
@@ -19,23 +25,146 @@ from openai import OpenAI
 from openai.types.chat import ChatCompletionSystemMessageParam, ChatCompletionUserMessageParam
 from PIL import Image
 from pydantic import BaseModel
+from pydantic_core import from_json, to_json
 
 from src.config.loader import DeepseekConfig, ModelConfig
 from src.schemas.inspection import InspectionTemplate
-from src.utils.logger import log, log_usage
-from src.utils.prompts import OCR_EXTRACTION_PROMPT
+from src.utils.cache import ResponseCache, cache_key
+from src.utils.logger import log, log_debug, log_usage
+from src.utils.prompts import (
+    OCR_EXTRACTION_SYSTEM_PROMPT,
+    OCR_EXTRACTION_USER_PROMPT,
+    OCR_LEGEND_PROMPT,
+    OCR_LEGEND_SECTION,
+    render_template_context,
+)
 
 # Load environment variables from .env file
 load_dotenv()
 
 T = TypeVar("T", bound=BaseModel)
 
-
 # OCR Prompt for DeepSeek
 OCR_PROMPT_GROUNDING = "<|grounding|>Convert the document to markdown."
 OCR_PROMPT_FREE = "Free OCR."
 
 
+def _fix_schema_for_openai(schema: Any) -> Any:
+    """
+    Return a copy of a JSON schema fixed for OpenAI strict mode:
+    1. Add additionalProperties: false to all objects
+    2. Ensure all properties are in the required array
+    3. Remove 'default' from properties with '$ref' (not allowed in strict mode)
+    
+    The input is left untouched, so the result can be cached and shared
+    without callers seeing each other's changes.
+    """
+    if isinstance(schema, list):
+        return [_fix_schema_for_openai(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    
+    # OpenAI strict mode: $ref cannot have additional keywords like 'default'
+    drop_default = "$ref" in schema
+    fixed = {
+        key: _fix_schema_for_openai(value)
+        for key, value in schema.items()
+        if not (drop_default and key == "default")
+    }
+    
+    # If this is an object with properties, fix it
+    if "properties" in fixed:
+        fixed["additionalProperties"] = False
+        # OpenAI strict mode requires ALL properties to be in required
+        fixed["required"] = list(fixed["properties"].keys())
+    
+    return fixed
+
+
+@lru_cache(maxsize=8)
+def _strict_schema(schema: type[BaseModel]) -> dict:
+    """
+    OpenAI strict-mode JSON schema for a model class.
+    
+    Cached per class; the returned dict is shared and only read when
+    building requests.
+    """
+    return _fix_schema_for_openai(schema.model_json_schema())
+
+
+_PAGE_MARKER = re.compile(r"^\[PAGE \d+\]$", re.MULTILINE)
+_SPACE_RUNS = re.compile(r"(?<=\S)[ \t]{2,}")
+_BLANK_RUNS = re.compile(r"\n{3,}")
+_PAGE_NUMBER_LINE = re.compile(r"^(page\s+\d+|(page\s+)?\d+\s+of\s+\d+)$", re.IGNORECASE)
+# Body of a page whose OCR failed (see _ocr_page)
+_OCR_FAILED_PREFIX = "[OCR FAILED"
+
+# Running headers/footers: lines within this many lines of a page's top or
+# bottom that recur on at least _MIN_REPEAT_PAGES pages
+_EDGE_LINES = 3
+_MIN_REPEAT_PAGES = 3
+
+
+def _compact_ocr_text(ocr_text: str) -> str:
+    """
+    Shrink OCR text before it is sent to the JSON model.
+    
+    Collapses runs of spaces and blank lines, drops bare page-number lines
+    ("Page 2 of 5"), and keeps only the first occurrence of running
+    headers/footers repeated across pages. Leading indentation and all
+    other lines are kept as-is.
+    
+    Args:
+        ocr_text: Text from _extract_text, with [PAGE N] markers
+        
+    Returns:
+        Compacted text with the same page markers
+    """
+    markers = _PAGE_MARKER.findall(ocr_text)
+    bodies = _PAGE_MARKER.split(ocr_text)
+    if markers:
+        bodies = bodies[1:]
+    else:
+        markers = [""]
+    
+    pages: list[list[str]] = []
+    for body in bodies:
+        lines = [_SPACE_RUNS.sub(" ", line).rstrip() for line in body.split("\n")]
+        pages.append([line for line in lines if not _PAGE_NUMBER_LINE.match(line.strip())])
+    
+    # Count on how many pages each edge line appears. OCR failure markers
+    # are never boilerplate: each one says that page is unreadable
+    edge_counts: dict[str, int] = {}
+    for lines in pages:
+        content = [line for line in lines if line and not line.startswith(_OCR_FAILED_PREFIX)]
+        for line in {*content[:_EDGE_LINES], *content[-_EDGE_LINES:]}:
+            edge_counts[line] = edge_counts.get(line, 0) + 1
+    boilerplate = {line for line, count in edge_counts.items() if count >= _MIN_REPEAT_PAGES}
+    
+    seen: set[str] = set()
+    compacted = []
+    for marker, lines in zip(markers, pages):
+        # Only the top and bottom lines of a page are candidates; the same
+        # text elsewhere on the page (e.g. a table header) is content
+        content_idx = [i for i, line in enumerate(lines) if line]
+        edge_idx = {
+            i for i in {*content_idx[:_EDGE_LINES], *content_idx[-_EDGE_LINES:]}
+            if lines[i] in boilerplate
+        }
+        kept = [line for i, line in enumerate(lines) if i not in edge_idx or line not in seen]
+        seen.update(lines[i] for i in edge_idx)
+        body = _BLANK_RUNS.sub("\n\n", "\n".join(kept)).strip()
+        compacted.append(f"{marker}\n{body}" if marker else body)
+    
+    return "\n\n".join(compacted)
+
+
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str | None, timeout: int, retries: int) -> OpenAI:
+    """OpenAI client for the JSON step, shared by all services using the same settings."""
+    return OpenAI(api_key=api_key, timeout=timeout, max_retries=retries)
+
+
 class OCRError(Exception):
     """Base exception for OCR-related errors."""
 
@@ -94,47 +223,110 @@ class DeepseekService:
             self.json_model = "gpt-5.1"
         
         self._openai_client = None
+        self._ollama_client = None
+        self._ocr_model_loaded = False
+        self._ocr_load_lock = threading.Lock()
+        self._ocr_options = {
+            key: value
+            for key, value in (
+                ("num_ctx", self.config.ocr_num_ctx),
+                ("num_predict", self.config.ocr_num_predict),
+            )
+            if value is not None
+        } or None
+        self._response_cache = (
+            ResponseCache(self.config.response_cache_dir, refresh=self.config.refresh_response_cache)
+            if self.config.response_cache_dir else None
+        )
+    
+    def _get_ollama_client(self) -> ollama.Client:
+        """Get or create the Ollama client (shared by all page requests)."""
+        if self._ollama_client is None:
+            self._ollama_client = ollama.Client(timeout=self.config.ocr_timeout)
+        return self._ollama_client
+    
+    def _load_ocr_model(self) -> None:
+        """
+        Load the OCR model into Ollama once, before the first page is sent.
+        
+        A cold load can take longer than a page's inference, so it gets its
+        own, longer timeout instead of eating into the first page's.
+        """
+        with self._ocr_load_lock:
+            if self._ocr_model_loaded:
+                return
+            log(f"Loading OCR model {self.ocr_model}...")
+            try:
+                # An empty prompt only loads the model
+                ollama.Client(timeout=self.config.ocr_load_timeout).generate(
+                    model=self.ocr_model,
+                    prompt="",
+                    keep_alive=self.config.ocr_keep_alive,
+                )
+            except Exception as e:
+                # Not fatal: the first page request loads it and reports any real error
+                log(f"Could not preload OCR model: {e}")
+            self._ocr_model_loaded = True
     
     def _get_openai_client(self) -> OpenAI:
         """Get or create the OpenAI client."""
         if self._openai_client is None:
-            api_key = os.getenv("OPENAI_API_KEY")
-            self._openai_client = OpenAI(api_key=api_key)
+            self._openai_client = _openai_client(
+                os.getenv("OPENAI_API_KEY"), self.config.json_timeout, self.config.json_retries
+            )
         return self._openai_client
     
     def _process_single_image_ocr(
         self,
         image: Image.Image,
         page_num: int = 1,
+        use_grounding: bool | None = None,
     ) -> str:
-        """Process a single image through OCR."""
-        prompt = OCR_PROMPT_GROUNDING if self.config.use_grounding else OCR_PROMPT_FREE
+        """Process a single image through OCR (grounding defaults to the config setting)."""
+        if use_grounding is None:
+            use_grounding = self.config.use_grounding
+        prompt = OCR_PROMPT_GROUNDING if use_grounding else OCR_PROMPT_FREE
         
+        # Encode in memory and hand Ollama the bytes (no temp file round-trip);
+        # PNG is lossless at any level, and level 1 is several times faster
         try:
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                image.save(tmp.name, format="PNG")
-                tmp_path = tmp.name
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG", compress_level=1)
+            image_bytes = buffer.getvalue()
         except Exception as e:
-            log(f"Failed to save image to temp file: {e}")
-            raise OCRProcessingError(f"Failed to save image to temporary file: {e}") from e
+            log(f"Failed to encode image: {e}")
+            raise OCRProcessingError(f"Failed to encode image: {e}") from e
+        
+        # OCR is the slowest stage; a page already read by this model with this
+        # prompt is served from disk
+        response_key = None
+        if self._response_cache is not None:
+            response_key = cache_key(b"ocr", self.ocr_model.encode(), prompt.encode(), image_bytes)
+            cached = self._response_cache.get(response_key)
+            if cached is not None:
+                log_debug(f"Using cached OCR text for page {page_num}")
+                cached.replay_usage()
+                return cached.text
+        
+        self._load_ocr_model()
         
         try:
-            # Create client with timeout
-            client = ollama.Client(timeout=self.config.ocr_timeout)
-            response = client.chat(
+            response = self._get_ollama_client().chat(
                 model=self.ocr_model,
                 messages=[{
                     "role": "user",
                     "content": prompt,
-                    "images": [tmp_path]
-                }]
+                    "images": [image_bytes]
+                }],
+                options=self._ocr_options,
+                keep_alive=self.config.ocr_keep_alive,
             )
             
             # Log token usage from Ollama response
             input_tokens = response.get("prompt_eval_count", 0)
             output_tokens = response.get("eval_count", 0)
             
-            log_usage(
+            usage_record = log_usage(
                 provider="ollama",
                 model=self.ocr_model,
                 input_tokens=input_tokens,
@@ -142,7 +334,10 @@ class DeepseekService:
                 operation=f"ocr_page_{page_num}"
             )
             
-            return response["message"]["content"]
+            text = response["message"]["content"]
+            if response_key is not None:
+                self._response_cache.put(response_key, text, usage=[usage_record])
+            return text
         except ollama.ResponseError as e:
             log(f"Ollama model error: {e}")
             raise OCRModelError(f"OCR model '{self.ocr_model}' error: {e}") from e
@@ -164,117 +359,219 @@ class DeepseekService:
                 raise OCRConnectionError(f"Failed to connect to Ollama: {e}") from e
             log(f"OCR processing error: {e}")
             raise OCRProcessingError(f"OCR processing failed: {e}") from e
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
     
-    def _extract_text(self, images: list[Image.Image]) -> str:
-        """Extract text from images using OCR."""
+    def _ocr_page(self, img: Image.Image, page_num: int, total_pages: int) -> tuple[str, bool]:
+        """
+        OCR one page, retrying without grounding if a grounded request times out.
+        
+        Args:
+            img: Page image
+            page_num: 1-based page number
+            total_pages: Total pages in the document (for logging)
+            
+        Returns:
+            Tuple of (page text block, whether the page failed)
+        """
+        # Born-digital pages already have exact text; OCR is only needed for scans
+        text_layer = img.info.get("text_layer") if self.config.use_text_layer else None
+        if text_layer:
+            log_debug(f"Page {page_num}/{total_pages} has a text layer, skipping OCR")
+            return f"[PAGE {page_num}]\n{text_layer}", False
+        
+        log_debug(f"Processing page {page_num}/{total_pages}...")
+        try:
+            text = self._process_single_image_ocr(img, page_num=page_num)
+            log_debug(f"Completed page {page_num}/{total_pages}")
+            return f"[PAGE {page_num}]\n{text}", False
+        except OCRTimeoutError:
+            # If grounding was enabled and timed out, retry without grounding
+            if self.config.use_grounding:
+                log(f"Timeout with grounding on page {page_num}, retrying without grounding...")
+                try:
+                    # Disable grounding for this retry only; the config is
+                    # shared with other services, so it is never mutated
+                    text = self._process_single_image_ocr(img, page_num=page_num, use_grounding=False)
+                    log_debug(f"Completed page {page_num}/{total_pages} (without grounding)")
+                    return f"[PAGE {page_num}]\n{text}", False
+                except Exception as retry_e:
+                    log(f"Failed page {page_num} after retry, skipping: {retry_e}")
+                    return f"[PAGE {page_num}]\n[OCR FAILED: {retry_e}]", True
+            log(f"Timeout on page {page_num} without grounding, skipping")
+            return f"[PAGE {page_num}]\n[OCR FAILED: Timeout]", True
+        except Exception as e:
+            log(f"Error processing page {page_num}, skipping: {e}")
+            return f"[PAGE {page_num}]\n[OCR FAILED: {e}]", True
+    
+    def _extract_text(
+        self,
+        images: list[Image.Image],
+        on_first_page: Callable[[str], None] | None = None,
+    ) -> str:
+        """
+        Extract text from images using OCR.
+        
+        Args:
+            images: Page images in order
+            on_first_page: Called with page 1's text as soon as it is available,
+                          while later pages may still be in progress
+            
+        Returns:
+            OCR text for all pages, each block marked with [PAGE N]
+        """
         log(f"Extracting text from {len(images)} images using {self.ocr_model}")
         
         if not images:
             raise OCRProcessingError("No images provided for OCR processing")
         
-        results = []
-        failed_pages = []
         total_pages = len(images)
         
-        for i, img in enumerate(images):
-            page_num = i + 1
-            log(f"Processing page {page_num}/{total_pages}...")
-            try:
-                text = self._process_single_image_ocr(img, page_num=page_num)
-                log(f"Completed page {page_num}/{total_pages}")
-                results.append(f"[PAGE {page_num}]\n{text}")
-            except OCRTimeoutError:
-                # If grounding was enabled and timed out, retry without grounding
-                if self.config.use_grounding:
-                    log(f"Timeout with grounding on page {page_num}, retrying without grounding...")
-                    try:
-                        # Temporarily disable grounding for retry
-                        original_grounding = self.config.use_grounding
-                        self.config.use_grounding = False
-                        text = self._process_single_image_ocr(img, page_num=page_num)
-                        self.config.use_grounding = original_grounding
-                        log(f"Completed page {page_num}/{total_pages} (without grounding)")
-                        results.append(f"[PAGE {page_num}]\n{text}")
-                    except Exception as retry_e:
-                        log(f"Failed page {page_num} after retry, skipping: {retry_e}")
-                        failed_pages.append(page_num)
-                        results.append(f"[PAGE {page_num}]\n[OCR FAILED: {retry_e}]")
-                else:
-                    log(f"Timeout on page {page_num} without grounding, skipping")
-                    failed_pages.append(page_num)
-                    results.append(f"[PAGE {page_num}]\n[OCR FAILED: Timeout]")
-            except Exception as e:
-                log(f"Error processing page {page_num}, skipping: {e}")
-                failed_pages.append(page_num)
-                results.append(f"[PAGE {page_num}]\n[OCR FAILED: {e}]")
+        # Routine per-page progress goes to debug; timings are summarized once below
+        def timed_ocr_page(img: Image.Image, page_num: int) -> tuple[str, bool, float]:
+            start = time.perf_counter()
+            text, failed = self._ocr_page(img, page_num, total_pages)
+            return text, failed, time.perf_counter() - start
+        
+        # Pages are independent Ollama round-trips, so several can be in flight
+        # at once; results come back in page order
+        max_workers = max(1, min(self.config.ocr_concurrency, total_pages))
+        page_results: list[tuple[str, bool, float]] = []
+        if max_workers == 1:
+            for i, img in enumerate(images):
+                page_results.append(timed_ocr_page(img, i + 1))
+                if i == 0 and on_first_page is not None:
+                    on_first_page(page_results[0][0])
+        else:
+            self._get_ollama_client()
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocr-page") as executor:
+                # Each page runs in a copy of the caller's context so usage capture still applies
+                futures = [
+                    executor.submit(contextvars.copy_context().run, timed_ocr_page, img, i + 1)
+                    for i, img in enumerate(images)
+                ]
+                for i, future in enumerate(futures):
+                    page_results.append(future.result())
+                    if i == 0 and on_first_page is not None:
+                        on_first_page(page_results[0][0])
         
+        failed_pages = [
+            page_num for page_num, (_, failed, _) in enumerate(page_results, start=1) if failed
+        ]
+        durations = sorted(seconds for _, _, seconds in page_results)
+        p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+        log(
+            f"OCR summary: {total_pages - len(failed_pages)} ok, {len(failed_pages)} failed, "
+            f"median {statistics.median(durations):.1f}s, p95 {p95:.1f}s per page"
+        )
         if failed_pages:
-            log(f"OCR completed with {len(failed_pages)} failed page(s): {failed_pages}")
+            log(f"Failed page(s): {failed_pages}")
         
-        return "\n\n".join(results)
+        return "\n\n".join(text for text, _, _ in page_results)
     
-    def _fix_schema_for_openai(self, schema: dict) -> dict:
+    def _extract_legend(self, page_text: str) -> str | None:
         """
-        Recursively fix schema for OpenAI strict mode:
-        1. Add additionalProperties: false to all objects
-        2. Ensure all properties are in the required array
-        3. Remove 'default' from properties with '$ref' (not allowed in strict mode)
+        Ask OpenAI for the form's legend/abbreviation key from its first page.
+        
+        Args:
+            page_text: OCR text of page 1
+            
+        Returns:
+            The legend as "ABBREVIATION = Meaning" lines, or None if there is none
         """
-        if isinstance(schema, dict):
-            # OpenAI strict mode: $ref cannot have additional keywords like 'default'
-            if "$ref" in schema and "default" in schema:
-                del schema["default"]
-
-            # If this is an object with properties, fix it
-            if "properties" in schema:
-                schema["additionalProperties"] = False
-                # OpenAI strict mode requires ALL properties to be in required
-                schema["required"] = list(schema["properties"].keys())
-
-            # Process all nested dictionaries
-            for value in schema.values():
-                if isinstance(value, dict):
-                    self._fix_schema_for_openai(value)
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, dict):
-                            self._fix_schema_for_openai(item)
-
-            # Process $defs (Pydantic's definitions)
-            if "$defs" in schema:
-                for def_schema in schema["$defs"].values():
-                    self._fix_schema_for_openai(def_schema)
-
-        return schema
+        prompt = OCR_LEGEND_PROMPT.format(ocr_text=_compact_ocr_text(page_text))
+        
+        # Cached like the main call: a different legend would also change the
+        # main extraction prompt and miss its cache entry
+        response_key = None
+        legend = None
+        if self._response_cache is not None:
+            response_key = cache_key(
+                b"legend",
+                self.json_model.encode(),
+                str(self.config.json_temperature).encode(),
+                prompt.encode(),
+            )
+            cached = self._response_cache.get(response_key)
+            if cached is not None:
+                cached.replay_usage()
+                legend = cached.text
+        
+        if legend is None:
+            response = self._get_openai_client().chat.completions.create(
+                model=self.json_model,
+                messages=[ChatCompletionUserMessageParam(role="user", content=prompt)],
+                temperature=self.config.json_temperature
+            )
+            usage_records = []
+            if response.usage:
+                usage_records.append(log_usage(
+                    provider="openai",
+                    model=self.json_model,
+                    input_tokens=response.usage.prompt_tokens,
+                    output_tokens=response.usage.completion_tokens,
+                    operation="legend_extraction"
+                ))
+            legend = (response.choices[0].message.content or "").strip()
+            if response_key is not None:
+                self._response_cache.put(response_key, legend, usage=usage_records)
+        
+        if not legend or legend == "NONE":
+            log("No legend found on page 1")
+            return None
+        log(f"Legend found on page 1 ({legend.count(chr(10)) + 1} entries)")
+        return legend
     
     def _extract_json(
         self,
         ocr_text: str,
         schema: type[T],
         context: dict | None = None,
+        legend: str | None = None,
     ) -> T:
-        """Extract structured JSON from OCR text using OpenAI."""
+        """Extract structured JSON from OCR text using OpenAI (with an optional pre-extracted legend)."""
         log(f"Extracting JSON using OpenAI [{self.json_model}]")
         
         client = self._get_openai_client()
         
-        # Generate and fix schema for OpenAI strict mode
-        json_schema = schema.model_json_schema()
-        json_schema = self._fix_schema_for_openai(json_schema)
+        # Generate and fix schema for OpenAI strict mode (once per model class)
+        json_schema = _strict_schema(schema)
         
-        prompt = OCR_EXTRACTION_PROMPT.format(
-            ocr_text=ocr_text,
-            template_context=json.dumps(context, indent=2) if context else "N/A"
+        # Input tokens drive the JSON call's cost and latency; strip OCR noise first
+        compact_text = _compact_ocr_text(ocr_text)
+        log(f"OCR text compacted from {len(ocr_text)} to {len(compact_text)} characters")
+        
+        # The rules go in an unchanging system message ahead of the per-document
+        # text, so OpenAI's automatic prompt caching can reuse that prefix
+        prompt = OCR_EXTRACTION_USER_PROMPT.format(
+            ocr_text=compact_text,
+            template_context=render_template_context(context)
         )
+        if legend:
+            prompt = OCR_LEGEND_SECTION.format(legend=legend) + prompt
+        
+        # Re-running on the same OCR text with the same model, prompt and
+        # schema reuses the stored result instead of paying for another call
+        response_key = None
+        if self._response_cache is not None:
+            response_key = cache_key(
+                b"json",
+                self.json_model.encode(),
+                str(self.config.json_temperature).encode(),
+                OCR_EXTRACTION_SYSTEM_PROMPT.encode(),
+                prompt.encode(),
+                to_json(json_schema),
+            )
+            cached = self._response_cache.get(response_key)
+            if cached is not None:
+                log(f"Using cached response {response_key[:12]}")
+                cached.replay_usage()
+                return from_json(cached.text)
         
         response = client.chat.completions.create(
             model=self.json_model,
             messages=[
                 ChatCompletionSystemMessageParam(
                     role="system",
-                    content="You are a precise document parser. Extract data according to the schema."
+                    content=OCR_EXTRACTION_SYSTEM_PROMPT
                 ),
                 ChatCompletionUserMessageParam(
                     role="user",
@@ -293,17 +590,22 @@ class DeepseekService:
         )
         
         # Log OpenAI token usage
+        usage_records = []
         if response.usage:
-            log_usage(
+            details = response.usage.prompt_tokens_details
+            usage_records.append(log_usage(
                 provider="openai",
                 model=self.json_model,
                 input_tokens=response.usage.prompt_tokens,
                 output_tokens=response.usage.completion_tokens,
+                cached_input_tokens=getattr(details, "cached_tokens", None) or 0,
                 operation="json_extraction"
-            )
+            ))
         
         result_text = response.choices[0].message.content
-        result_dict = json.loads(result_text) if result_text else {}
+        result_dict = from_json(result_text) if result_text else {}
+        if response_key is not None and result_text:
+            self._response_cache.put(response_key, result_text, usage=usage_records)
 
         return result_dict
     
@@ -330,14 +632,33 @@ class DeepseekService:
         log(f"Starting Deepseek pipeline for {len(images)} image(s)")
         log(f"OCR Model: {self.ocr_model}, JSON Model: {self.json_model}")
         
-        # Step 1: OCR
+        # Step 1: OCR. With the legend pre-pass on, page 1's legend is read by
+        # OpenAI in the background while the remaining pages are OCR'd
         log("Step 1: Running OCR...")
-        ocr_text = self._extract_text(images)
-        log(f"OCR completed: {len(ocr_text)} characters extracted")
+        legend_future: Future[str | None] | None = None
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="legend") as legend_executor:
+            def start_legend(page_text: str) -> None:
+                nonlocal legend_future
+                legend_future = legend_executor.submit(
+                    contextvars.copy_context().run, self._extract_legend, page_text
+                )
+            
+            ocr_text = self._extract_text(
+                images, on_first_page=start_legend if self.config.legend_prepass else None
+            )
+            log(f"OCR completed: {len(ocr_text)} characters extracted")
+            
+            legend = None
+            if legend_future is not None:
+                try:
+                    legend = legend_future.result()
+                except Exception as e:
+                    # The main prompt already asks the model to find the legend itself
+                    log(f"Legend pre-pass failed, continuing without it: {e}")
         
         # Step 2: JSON extraction
         log("Step 2: Extracting structured JSON...")
-        result = self._extract_json(ocr_text, schema, context)
+        result = self._extract_json(ocr_text, schema, context, legend=legend)
         
         log("Deepseek pipeline completed successfully")
         return result
@@ -5,9 +5,12 @@ Uses Google's Gemini models (e.g., Gemini 3 Flash) to extract structured JSON
 directly from images in a single LLM request.
 """
 
+import contextvars
 import io
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from dotenv import load_dotenv
@@ -15,16 +18,21 @@ from google import genai
 from google.genai import types
 from PIL import Image
 from pydantic import BaseModel
+from pydantic_core import from_json
 
 from src.config.loader import GoogleConfig, ModelConfig
-from src.schemas.inspection import (
-    MaintenanceCategory,
-    WorkOrderSubCategory,
+from src.utils.enums import (
+    MAINTENANCE_CATEGORIES_JSON,
+    WORK_ORDER_SUBCATEGORIES_JSON,
+    normalize_enum_values,
 )
-from src.services.providers.bedrock import normalize_enum_values
 from src.utils.logger import log, log_usage
 from src.utils.merge import merge_section_responses
-from src.utils.prompts import VISION_EXTRACTION_PROMPT, VISION_EXTRACTION_PROMPT_CONTINUATION
+from src.utils.prompts import (
+    VISION_EXTRACTION_PROMPT,
+    VISION_EXTRACTION_PROMPT_CONTINUATION,
+    render_template_context,
+)
 
 # Load environment variables from .env file
 load_dotenv()
@@ -32,6 +40,29 @@ load_dotenv()
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=8)
+def _schema_json(schema: type[BaseModel]) -> str:
+    """Get the indented JSON schema text for a model class (cached per class)."""
+    return json.dumps(schema.model_json_schema(), indent=2)
+
+
+@lru_cache(maxsize=4)
+def _genai_client(api_key: str, timeout: int, retries: int) -> genai.Client:
+    """
+    Create a Gemini client, cached per key, timeout and retry count.
+
+    Runs for different PDFs share the client, and with it the underlying
+    HTTP connection pool, instead of each service opening its own.
+    """
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(
+            timeout=timeout * 1000,  # milliseconds
+            retry_options=types.HttpRetryOptions(attempts=retries + 1),
+        ),
+    )
+
+
 class GoogleError(Exception):
     """Base exception for Google AI-related errors."""
 
@@ -88,7 +119,7 @@ class GoogleService:
                 )
 
             try:
-                self._client = genai.Client(api_key=api_key)
+                self._client = _genai_client(api_key, self.config.timeout, self.config.retries)
             except Exception as e:
                 raise GoogleConnectionError(
                     f"Failed to create Google AI client: {e}"
@@ -140,33 +171,49 @@ class GoogleService:
         total_chunks = len(chunks)
         log(f"Split into {total_chunks} chunks")
 
-        # Process each chunk
-        chunk_responses: list[dict] = []
-        current_page = 1
+        # Create the shared client up front so worker threads don't race to build it
+        self._get_client()
+
+        # Chunk requests are independent and network-bound, so several are sent
+        # at once; responses are collected back in page order
+        max_workers = max(1, min(self.config.max_concurrency, total_chunks))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="google-chunk") as executor:
+            futures = []
+            current_page = 1
+
+            for chunk_idx, chunk_images in enumerate(chunks):
+                chunk_number = chunk_idx + 1
+                page_start = current_page
+                page_end = current_page + len(chunk_images) - 1
+
+                log(f"Processing chunk {chunk_number}/{total_chunks} (pages {page_start}-{page_end})...")
+
+                chunk_info = {
+                    "chunk_number": chunk_number,
+                    "total_chunks": total_chunks,
+                    "page_start": page_start,
+                    "page_end": page_end,
+                    "total_pages": total_images,
+                }
+
+                # Run in a copy of the caller's context so usage capture still applies
+                futures.append(executor.submit(
+                    contextvars.copy_context().run,
+                    self._generate_json_chunk,
+                    images=chunk_images,
+                    schema=schema,
+                    context=context,
+                    chunk_info=chunk_info,
+                ))
+                current_page = page_end + 1
 
-        for chunk_idx, chunk_images in enumerate(chunks):
-            chunk_number = chunk_idx + 1
-            page_start = current_page
-            page_end = current_page + len(chunk_images) - 1
-
-            log(f"Processing chunk {chunk_number}/{total_chunks} (pages {page_start}-{page_end})...")
-
-            chunk_info = {
-                "chunk_number": chunk_number,
-                "total_chunks": total_chunks,
-                "page_start": page_start,
-                "page_end": page_end,
-                "total_pages": total_images,
-            }
-
-            chunk_result = self._generate_json_chunk(
-                images=chunk_images,
-                schema=schema,
-                context=context,
-                chunk_info=chunk_info,
-            )
-            chunk_responses.append(chunk_result)
-            current_page = page_end + 1
+            try:
+                chunk_responses: list[dict] = [future.result() for future in futures]
+            except Exception:
+                # Don't send the remaining chunks once one has failed
+                for future in futures:
+                    future.cancel()
+                raise
 
         # Merge all chunk responses
         log(f"Merging {len(chunk_responses)} chunk responses...")
@@ -197,12 +244,8 @@ class GoogleService:
         """
         client = self._get_client()
 
-        # Generate JSON schema from Pydantic model
-        json_schema = schema.model_json_schema()
-
-        # Get enum values as strings for the prompt
-        maintenance_categories = [cat.value for cat in MaintenanceCategory]
-        work_order_subcategories = [sub.value for sub in WorkOrderSubCategory]
+        # JSON schema text for the Pydantic model (generated once per class)
+        json_schema = _schema_json(schema)
 
         # Build the prompt - use continuation prompt for chunk 2+
         if chunk_info and chunk_info["chunk_number"] > 1:
@@ -212,17 +255,17 @@ class GoogleService:
                 page_start=chunk_info["page_start"],
                 page_end=chunk_info["page_end"],
                 total_pages=chunk_info["total_pages"],
-                json_schema=json.dumps(json_schema, indent=2),
-                template_context=json.dumps(context, indent=2) if context else "N/A",
-                maintenance_categories=json.dumps(maintenance_categories, indent=2),
-                work_order_subcategories=json.dumps(work_order_subcategories, indent=2),
+                json_schema=json_schema,
+                template_context=render_template_context(context),
+                maintenance_categories=MAINTENANCE_CATEGORIES_JSON,
+                work_order_subcategories=WORK_ORDER_SUBCATEGORIES_JSON,
             )
         else:
             prompt = VISION_EXTRACTION_PROMPT.format(
-                json_schema=json.dumps(json_schema, indent=2),
-                template_context=json.dumps(context, indent=2) if context else "N/A",
-                maintenance_categories=json.dumps(maintenance_categories, indent=2),
-                work_order_subcategories=json.dumps(work_order_subcategories, indent=2),
+                json_schema=json_schema,
+                template_context=render_template_context(context),
+                maintenance_categories=MAINTENANCE_CATEGORIES_JSON,
+                work_order_subcategories=WORK_ORDER_SUBCATEGORIES_JSON,
             )
 
         # Build content parts: text prompt first, then all images
@@ -281,19 +324,12 @@ class GoogleService:
             ) from e
 
         # Parse JSON from response (handle markdown code blocks)
-        result_text = result_text.strip()
-        if result_text.startswith("```json"):
-            result_text = result_text[7:]
-        if result_text.startswith("```"):
-            result_text = result_text[3:]
-        if result_text.endswith("```"):
-            result_text = result_text[:-3]
-        result_text = result_text.strip()
+        result_text = result_text.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
 
         # Validate against Pydantic model
         try:
-            result_dict = json.loads(result_text)
-        except json.JSONDecodeError as e:
+            result_dict = from_json(result_text)
+        except ValueError as e:
             log(f"Failed to parse JSON response: {e}")
             log(f"Response text: {result_text[:2000]}...")
             raise GoogleModelError(f"Invalid JSON in response: {e}") from e
@@ -11,27 +11,33 @@ Reference: https://platform.openai.com/docs/guides/structured-outputs
 """
 
 import base64
+import contextvars
 import io
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, TypeVar
 
 import openai
+from openai.types.chat import ChatCompletion
 from dotenv import load_dotenv
 from PIL import Image
 from pydantic import BaseModel
+from pydantic_core import from_json, to_json
 
 from src.config.loader import OpenAIConfig, ModelConfig
-from src.schemas.inspection import (
-    MaintenanceCategory,
-    WorkOrderSubCategory,
+from src.config.pricing import calculate_cost
+from src.utils.enums import (
+    MAINTENANCE_CATEGORIES_JSON,
+    WORK_ORDER_SUBCATEGORIES_JSON,
+    normalize_enum_values,
 )
-from src.services.providers.bedrock import normalize_enum_values
 from src.utils.logger import log, log_usage
 from src.utils.merge import merge_section_responses
 from src.utils.prompts import (
     VISION_EXTRACTION_PROMPT_ANTHROPIC,
     VISION_EXTRACTION_PROMPT_ANTHROPIC_CONTINUATION,
+    render_template_context,
 )
 
 # Load environment variables from .env file
@@ -39,6 +45,9 @@ load_dotenv()
 
 T = TypeVar("T", bound=BaseModel)
 
+# Batch API requests are billed at half the synchronous price
+BATCH_PRICE_FACTOR = 0.5
+
 
 class OpenAIError(Exception):
     """Base exception for OpenAI-related errors."""
@@ -52,10 +61,25 @@ class OpenAIModelError(OpenAIError):
     """Raised when the model is not available or fails."""
 
 
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str, timeout: int, retries: int) -> openai.OpenAI:
+    """
+    Create an OpenAI client, cached per key, timeout and retry count.
+    
+    Services are built per PDF/model run; sharing the client reuses its
+    httpx connection pool (and TLS sessions) across runs and threads.
+    """
+    return openai.OpenAI(api_key=api_key, timeout=timeout, max_retries=retries)
+
+
+@lru_cache(maxsize=8)
 def _pydantic_to_strict_schema(schema: type[BaseModel]) -> dict[str, Any]:
     """
     Convert a Pydantic model to OpenAI strict JSON schema format.
 
+    Cached per model class, so the returned dict is shared and must not be
+    modified by callers.
+
     OpenAI structured outputs require:
     - additionalProperties: false on all objects
     - All properties must be in "required" array
@@ -145,10 +169,7 @@ class OpenAIService:
                 )
 
             try:
-                self._client = openai.OpenAI(
-                    api_key=api_key,
-                    timeout=self.config.timeout,
-                )
+                self._client = _openai_client(api_key, self.config.timeout, self.config.retries)
             except Exception as e:
                 raise OpenAIConnectionError(
                     f"Failed to create OpenAI client: {e}"
@@ -185,8 +206,10 @@ class OpenAIService:
 
         log(f"Extracting JSON from {total_images} image(s) using OpenAI [{self.model_id}] with structured outputs")
 
+        chunks = self._plan_chunks(images)
+
         # If images fit in a single chunk, process directly
-        if total_images <= chunk_size:
+        if len(chunks) == 1:
             return self._generate_json_chunk(
                 images=images,
                 schema=schema,
@@ -196,48 +219,198 @@ class OpenAIService:
 
         # Process in chunks and merge
         log(f"Document has {total_images} pages, processing in chunks of {chunk_size}...")
+        log(f"Split into {len(chunks)} chunks")
+
+        # Create the shared client up front so worker threads don't race to build it
+        self._get_client()
+
+        # Chunk requests are independent and network-bound, so several are sent
+        # at once; responses are collected back in page order
+        max_workers = max(1, min(self.config.max_concurrency, len(chunks)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="openai-chunk") as executor:
+            futures = []
+            for chunk_images, chunk_info in chunks:
+                log(
+                    f"Processing chunk {chunk_info['chunk_number']}/{chunk_info['total_chunks']} "
+                    f"(pages {chunk_info['page_start']}-{chunk_info['page_end']})..."
+                )
 
-        chunks: list[list[Image.Image]] = []
-        for i in range(0, total_images, chunk_size):
-            chunks.append(images[i:i + chunk_size])
+                # Run in a copy of the caller's context so usage capture still applies
+                futures.append(executor.submit(
+                    contextvars.copy_context().run,
+                    self._generate_json_chunk,
+                    images=chunk_images,
+                    schema=schema,
+                    context=context,
+                    chunk_info=chunk_info,
+                ))
 
-        total_chunks = len(chunks)
-        log(f"Split into {total_chunks} chunks")
+            try:
+                chunk_responses: list[dict] = [future.result() for future in futures]
+            except Exception:
+                # Don't send the remaining chunks once one has failed
+                for future in futures:
+                    future.cancel()
+                raise
 
-        # Process each chunk
-        chunk_responses: list[dict] = []
-        current_page = 1
+        # Merge all chunk responses
+        log(f"Merging {len(chunk_responses)} chunk responses...")
+        merged_result = merge_section_responses(chunk_responses)
 
-        for chunk_idx, chunk_images in enumerate(chunks):
-            chunk_number = chunk_idx + 1
-            page_start = current_page
-            page_end = current_page + len(chunk_images) - 1
+        log("Chunked extraction and merge completed successfully")
+        return merged_result
 
-            log(f"Processing chunk {chunk_number}/{total_chunks} (pages {page_start}-{page_end})...")
+    def _plan_chunks(
+        self, images: list[Image.Image]
+    ) -> list[tuple[list[Image.Image], dict | None]]:
+        """
+        Split a document's pages into request-sized chunks.
 
-            chunk_info = {
-                "chunk_number": chunk_number,
-                "total_chunks": total_chunks,
-                "page_start": page_start,
-                "page_end": page_end,
+        Args:
+            images: List of PIL Images (one per page)
+
+        Returns:
+            List of (chunk images, chunk_info) pairs; chunk_info is None when
+            the document fits in a single request
+        """
+        chunk_size = self.config.chunk_size
+        total_images = len(images)
+        if total_images <= chunk_size:
+            return [(images, None)]
+
+        starts = range(0, total_images, chunk_size)
+        chunks: list[tuple[list[Image.Image], dict | None]] = []
+        for chunk_idx, start in enumerate(starts):
+            chunk_images = images[start:start + chunk_size]
+            chunks.append((chunk_images, {
+                "chunk_number": chunk_idx + 1,
+                "total_chunks": len(starts),
+                "page_start": start + 1,
+                "page_end": start + len(chunk_images),
                 "total_pages": total_images,
-            }
+            }))
+        return chunks
 
-            chunk_result = self._generate_json_chunk(
-                images=chunk_images,
-                schema=schema,
-                context=context,
-                chunk_info=chunk_info,
+    def submit_batch(
+        self,
+        documents: dict[str, list[Image.Image]],
+        schema: type[T],
+        context: dict | None = None,
+    ) -> str:
+        """
+        Submit many documents as one OpenAI Batch API job.
+
+        For bulk runs that can wait (up to 24h) in exchange for half-price
+        tokens. Each chunk of each document becomes one request line; use
+        collect_batch() with the returned id to fetch the merged results.
+
+        Args:
+            documents: Page images keyed by a caller-chosen document id
+            schema: Pydantic model class for the output schema
+            context: Optional template dictionary for additional context
+
+        Returns:
+            The batch id
+        """
+        client = self._get_client()
+
+        lines: list[bytes] = []
+        for doc_id, images in documents.items():
+            for chunk_images, chunk_info in self._plan_chunks(images):
+                chunk_number = chunk_info["chunk_number"] if chunk_info else 1
+                body = self._build_chunk_request(chunk_images, schema, context, chunk_info)
+                lines.append(to_json({
+                    "custom_id": f"{doc_id}#{chunk_number}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body,
+                }))
+
+        log(f"Submitting OpenAI batch: {len(documents)} document(s), {len(lines)} request(s)")
+        try:
+            batch_file = client.files.create(
+                file=("batch.jsonl", b"\n".join(lines)),
+                purpose="batch",
+            )
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
             )
-            chunk_responses.append(chunk_result)
-            current_page = page_end + 1
+        except openai.APIError as e:
+            log(f"OpenAI API error: {e}")
+            raise OpenAIModelError(f"OpenAI batch submission failed: {e}") from e
 
-        # Merge all chunk responses
-        log(f"Merging {len(chunk_responses)} chunk responses...")
-        merged_result = merge_section_responses(chunk_responses)
+        log(f"Submitted batch {batch.id}")
+        return batch.id
 
-        log("Chunked extraction and merge completed successfully")
-        return merged_result
+    def collect_batch(self, batch_id: str) -> dict[str, dict] | None:
+        """
+        Fetch the results of a batch submitted with submit_batch().
+
+        Args:
+            batch_id: Id returned by submit_batch()
+
+        Returns:
+            Extracted data keyed by document id (chunks merged in page order),
+            or None if the batch is still running. Documents with a failed
+            request are logged and left out. Usage records logged here carry
+            the document id in their metadata.
+        """
+        client = self._get_client()
+        try:
+            batch = client.batches.retrieve(batch_id)
+        except openai.APIError as e:
+            raise OpenAIModelError(f"Failed to retrieve batch {batch_id}: {e}") from e
+
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise OpenAIModelError(f"Batch {batch_id} ended with status '{batch.status}'")
+        if batch.status != "completed":
+            log(f"Batch {batch_id} is {batch.status}")
+            return None
+
+        chunk_results: dict[str, dict[int, dict]] = {}
+        failed_docs: set[str] = set()
+        output = client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+        for line in output.splitlines():
+            if not line:
+                continue
+            record = from_json(line)
+            doc_id, _, chunk_number = record["custom_id"].rpartition("#")
+            response = record.get("response")
+            if record.get("error") or not response or response.get("status_code") != 200:
+                log(f"Batch request {record['custom_id']} failed: {record.get('error') or response}")
+                failed_docs.add(doc_id)
+                continue
+            completion = ChatCompletion.model_validate(response["body"])
+            input_tokens = completion.usage.prompt_tokens if completion.usage else 0
+            output_tokens = completion.usage.completion_tokens if completion.usage else 0
+            cost_usd = calculate_cost("openai", self.model_id, input_tokens, output_tokens) * BATCH_PRICE_FACTOR
+            try:
+                chunk_results.setdefault(doc_id, {})[int(chunk_number)] = self._parse_chunk_response(
+                    completion, operation="batch_image_to_json_extraction", cost_usd=cost_usd,
+                    document_id=doc_id,
+                )
+            except OpenAIError as e:
+                log(f"Batch request {record['custom_id']} unusable: {e}")
+                failed_docs.add(doc_id)
+
+        # Requests that errored before reaching the model land in the error file
+        if batch.error_file_id:
+            for line in client.files.content(batch.error_file_id).text.splitlines():
+                if line:
+                    failed_docs.add(from_json(line)["custom_id"].rpartition("#")[0])
+
+        results: dict[str, dict] = {}
+        for doc_id, chunks in chunk_results.items():
+            if doc_id in failed_docs:
+                continue
+            ordered = [chunks[number] for number in sorted(chunks)]
+            results[doc_id] = ordered[0] if len(ordered) == 1 else merge_section_responses(ordered)
+
+        if failed_docs:
+            log(f"Batch {batch_id}: {len(failed_docs)} document(s) failed: {sorted(failed_docs)}")
+        return results
 
     def _generate_json_chunk(
         self,
@@ -260,11 +433,41 @@ class OpenAIService:
             Extracted data as dict (not yet validated against schema)
         """
         client = self._get_client()
+        request_params = self._build_chunk_request(images, schema, context, chunk_info)
+
+        # Send request to OpenAI using Chat Completions with structured outputs
+        try:
+            log("Sending request to OpenAI with structured outputs...")
+            # Type checkers may not understand the dynamic request dict, so we ignore typing here.
+            response = client.chat.completions.create(**request_params)  # type: ignore
+        except openai.APIError as e:
+            log(f"OpenAI API error: {e}")
+            raise OpenAIModelError(f"OpenAI API error: {e}") from e
+        except Exception as e:
+            log(f"Unexpected error calling OpenAI: {e}")
+            raise OpenAIError(f"Unexpected error calling OpenAI: {e}") from e
+
+        return self._parse_chunk_response(response)
+
+    def _build_chunk_request(
+        self,
+        images: list[Image.Image],
+        schema: type[T],
+        context: dict | None = None,
+        chunk_info: dict | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build the Chat Completions request body for one chunk of images.
 
-        # Get enum values as strings for the prompt
-        maintenance_categories = [cat.value for cat in MaintenanceCategory]
-        work_order_subcategories = [sub.value for sub in WorkOrderSubCategory]
+        Args:
+            images: List of PIL Images for this chunk
+            schema: Pydantic model class for the output schema
+            context: Optional template dictionary for additional context
+            chunk_info: Optional chunk position for continuation prompts
 
+        Returns:
+            Keyword arguments for chat.completions.create (also the batch line body)
+        """
         # Build the prompt - use continuation prompt for chunk 2+
         if chunk_info and chunk_info["chunk_number"] > 1:
             prompt = VISION_EXTRACTION_PROMPT_ANTHROPIC_CONTINUATION.format(
@@ -273,15 +476,15 @@ class OpenAIService:
                 page_start=chunk_info["page_start"],
                 page_end=chunk_info["page_end"],
                 total_pages=chunk_info["total_pages"],
-                template_context=json.dumps(context, indent=2) if context else "N/A",
-                maintenance_categories=json.dumps(maintenance_categories, indent=2),
-                work_order_subcategories=json.dumps(work_order_subcategories, indent=2),
+                template_context=render_template_context(context),
+                maintenance_categories=MAINTENANCE_CATEGORIES_JSON,
+                work_order_subcategories=WORK_ORDER_SUBCATEGORIES_JSON,
             )
         else:
             prompt = VISION_EXTRACTION_PROMPT_ANTHROPIC.format(
-                template_context=json.dumps(context, indent=2) if context else "N/A",
-                maintenance_categories=json.dumps(maintenance_categories, indent=2),
-                work_order_subcategories=json.dumps(work_order_subcategories, indent=2),
+                template_context=render_template_context(context),
+                maintenance_categories=MAINTENANCE_CATEGORIES_JSON,
+                work_order_subcategories=WORK_ORDER_SUBCATEGORIES_JSON,
             )
 
         # Build content parts: text prompt first, then images (OpenAI convention)
@@ -291,8 +494,8 @@ class OpenAIService:
             log(f"Adding image {i + 1}/{len(images)} to request...")
             buffer = io.BytesIO()
             img.save(buffer, format="PNG")
-            image_bytes = buffer.getvalue()
-            image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+            # Encode straight from the buffer's memory; only the base64 text is kept
+            image_base64 = base64.b64encode(buffer.getbuffer()).decode("ascii")
 
             # OpenAI expects images in this format
             content.append({
@@ -307,33 +510,42 @@ class OpenAIService:
         strict_schema = _pydantic_to_strict_schema(schema)
         log(f"Using structured outputs with schema: {schema.__name__}")
 
-        # Send request to OpenAI using Chat Completions with structured outputs
-        try:
-            log("Sending request to OpenAI with structured outputs...")
-            request_params: dict[str, Any] = {
-                "model": self.model_id,
-                "max_completion_tokens": self.config.max_tokens,
-                # Some models (e.g., gpt-5-mini) do not allow temperature overrides;
-                # omit to use the model default.
-                "messages": [{"role": "user", "content": content}],
-                "response_format": {
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": schema.__name__,
-                        "schema": strict_schema,
-                        "strict": True,
-                    },
+        request_params: dict[str, Any] = {
+            "model": self.model_id,
+            "max_completion_tokens": self.config.max_tokens,
+            # Some models (e.g., gpt-5-mini) do not allow temperature overrides;
+            # omit to use the model default.
+            "messages": [{"role": "user", "content": content}],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": schema.__name__,
+                    "schema": strict_schema,
+                    "strict": True,
                 },
-            }
-            # Type checkers may not understand the dynamic request dict, so we ignore typing here.
-            response = client.chat.completions.create(**request_params)  # type: ignore
-        except openai.APIError as e:
-            log(f"OpenAI API error: {e}")
-            raise OpenAIModelError(f"OpenAI API error: {e}") from e
-        except Exception as e:
-            log(f"Unexpected error calling OpenAI: {e}")
-            raise OpenAIError(f"Unexpected error calling OpenAI: {e}") from e
+            },
+        }
+        return request_params
 
+    def _parse_chunk_response(
+        self,
+        response: ChatCompletion,
+        operation: str = "image_to_json_extraction",
+        cost_usd: float | None = None,
+        **usage_metadata: Any,
+    ) -> dict:
+        """
+        Check, log and parse a chat completion for one chunk.
+
+        Args:
+            response: Chat completion returned by the API (or from a batch)
+            operation: Operation name for usage logging
+            cost_usd: Cost override for usage logging (None = list price)
+            **usage_metadata: Extra metadata for the usage record
+
+        Returns:
+            Extracted data as dict (not yet validated against schema)
+        """
         # Check for refusals or truncation
         choice = response.choices[0] if response.choices else None
         if choice:
@@ -351,13 +563,19 @@ class OpenAIService:
         if response.usage:
             input_tokens = response.usage.prompt_tokens
             output_tokens = response.usage.completion_tokens
+            # Prompt-cache hits on the shared instruction prefix
+            details = response.usage.prompt_tokens_details
+            cached_tokens = getattr(details, "cached_tokens", None) or 0
 
             log_usage(
                 provider="openai",
                 model=self.model_id,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
-                operation="image_to_json_extraction",
+                cached_input_tokens=cached_tokens,
+                cost_usd=cost_usd,
+                operation=operation,
+                **usage_metadata,
             )
 
         # Extract response text - structured outputs guarantees valid JSON
@@ -371,8 +589,8 @@ class OpenAIService:
 
         # Parse JSON - should always be valid due to structured outputs
         try:
-            result_dict = json.loads(result_text)
-        except json.JSONDecodeError as e:
+            result_dict = from_json(result_text)
+        except ValueError as e:
             log(f"Failed to parse JSON response: {e}")
             log(f"Response text: {result_text[:2000]}...")
             raise OpenAIModelError(f"Invalid JSON in response: {e}") from e
@@ -2,9 +2,14 @@
 Utility modules for OCR-AI.
 
 Contains PDF processing, logging, and other helper functions.
+
+The PDF helpers (and PyMuPDF behind them) are imported on first use, since
+most importers only need the logger.
 """
 
-from .pdf import pdf_to_images
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .logger import (
     log,
     log_debug,
@@ -13,6 +18,7 @@ from .logger import (
     log_usage,
     get_tracker,
     reset_tracker,
+    capture_usage,
     UsageTracker,
     UsageRecord,
 )
@@ -22,6 +28,13 @@ from .prompts import (
     EXTRACTION_PROMPT,
 )
 
+if TYPE_CHECKING:
+    from .pdf import pdf_to_images
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "pdf_to_images": ".pdf",
+}
+
 __all__ = [
     # PDF utilities
     "pdf_to_images",
@@ -33,6 +46,7 @@ __all__ = [
     "log_usage",
     "get_tracker",
     "reset_tracker",
+    "capture_usage",
     "UsageTracker",
     "UsageRecord",
     # Prompts
@@ -40,3 +54,15 @@ __all__ = [
     "OCR_EXTRACTION_PROMPT",
     "EXTRACTION_PROMPT",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,121 @@
+"""
+On-disk Response Cache.
+
+Content-addressed store for LLM responses, so re-running extraction on an
+unchanged document with the same model and prompt reads the previous answer
+from disk instead of issuing another API call.
+
+Each entry keeps the usage of the call that produced it, so a replayed answer
+reports the same tokens and cost as the original run.
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from src.utils.logger import UsageRecord, log_usage
+
+
+def cache_key(*parts: bytes) -> str:
+    """
+    Build a cache key from the parts of a request.
+
+    Each part is length-prefixed before hashing so that different splits of
+    the same bytes can never collide.
+
+    Args:
+        *parts: Raw request components (model id, prompt, image bytes, ...)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class CachedResponse(BaseModel):
+    """A stored response and the usage of the call that produced it."""
+    text: str
+    usage: list[UsageRecord] = []
+
+    def replay_usage(self) -> None:
+        """Log the original call's usage again, marked as a cache hit."""
+        for record in self.usage:
+            log_usage(
+                provider=record.provider,
+                model=record.model,
+                input_tokens=record.input_tokens,
+                output_tokens=record.output_tokens,
+                cached_input_tokens=record.cached_input_tokens,
+                cache_write_input_tokens=record.cache_write_input_tokens,
+                cost_usd=record.cost_usd,
+                operation=record.operation,
+                response_cache_hit=True,
+            )
+
+
+class ResponseCache:
+    """Directory of cached responses, one file per key."""
+
+    def __init__(self, root: str | Path, refresh: bool = False):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Directory holding the cache entries (created on first write)
+            refresh: Ignore stored entries (every get() misses) but keep
+                writing new ones, to force fresh model calls
+        """
+        self.root = Path(root)
+        self.refresh = refresh
+
+    def _path(self, key: str) -> Path:
+        # Fan out by the first two hex characters to keep directories small
+        return self.root / key[:2] / key
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Read a cached response.
+
+        Args:
+            key: Key from cache_key()
+
+        Returns:
+            The stored response, or None on a miss (or when refreshing)
+        """
+        if self.refresh:
+            return None
+        try:
+            data = self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            return CachedResponse.model_validate_json(data)
+        except ValidationError:
+            # Entry from an older format without usage; call the model again
+            return None
+
+    def put(self, key: str, text: str, usage: list[UsageRecord] | None = None) -> None:
+        """
+        Store a response.
+
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial entry.
+
+        Args:
+            key: Key from cache_key()
+            text: Response text to store
+            usage: Usage records of the call(s) that produced the response
+        """
+        value = CachedResponse(text=text, usage=usage or []).model_dump_json().encode()
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(value)
+        os.replace(tmp_path, path)
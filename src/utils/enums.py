@@ -0,0 +1,55 @@
+"""
+Enum helpers shared by the extraction providers.
+
+Renders the allowed enum values for prompts and repairs enum values returned
+by the models. Kept separate from any one provider so that importing a
+provider does not pull in another provider's SDK.
+"""
+
+import json
+from typing import Any
+
+from src.schemas.inspection import MaintenanceCategory, WorkOrderSubCategory
+
+# Fields that contain enum values needing normalization (built once, not per call)
+_ENUM_FIELDS = frozenset({
+    "rating_type",
+    "work_order_category",
+    "work_order_sub_category",
+    "display_type",
+})
+
+# Allowed enum values, rendered once for every provider's prompts
+MAINTENANCE_CATEGORIES_JSON = json.dumps([cat.value for cat in MaintenanceCategory], indent=2)
+WORK_ORDER_SUBCATEGORIES_JSON = json.dumps([sub.value for sub in WorkOrderSubCategory], indent=2)
+
+
+def normalize_enum_values(obj: Any) -> Any:
+    """
+    Normalize enum field values to uppercase with underscores, in place.
+    
+    Fixes common LLM mistakes like:
+    - 'RATING_TYPE-select' -> 'RATING_TYPE_SELECT'
+    - 'WORK_ORDER_SUB_CATEGORY_CARPENTRY_FLOORBOARD_REpair' -> 'WORK_ORDER_SUB_CATEGORY_CARPENTRY_FLOORBOARD_REPAIR'
+    
+    Args:
+        obj: Freshly parsed response (dicts and lists); it is modified in place
+        
+    Returns:
+        The same object, for convenience
+    """
+    # Walk the tree with an explicit stack so deeply nested sections can't
+    # hit the recursion limit
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in _ENUM_FIELDS and isinstance(value, str):
+                    # Normalize: replace hyphens with underscores, uppercase everything
+                    node[key] = value.replace("-", "_").upper()
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+    return obj
@@ -5,10 +5,14 @@ Simple, generalized logging utility for OCR-AI.
 """
 
 import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from src.config.pricing import calculate_cost
 
@@ -27,6 +31,8 @@ class UsageRecord(BaseModel):
     model: str
     input_tokens: int = 0
     output_tokens: int = 0
+    cached_input_tokens: int = 0
+    cache_write_input_tokens: int = 0
     total_tokens: int = 0
     cost_usd: float = 0.0
     timestamp: datetime = Field(default_factory=datetime.now)
@@ -35,8 +41,9 @@ class UsageRecord(BaseModel):
 
 
 class UsageTracker(BaseModel):
-    """Tracks cumulative usage across multiple API calls."""
+    """Tracks cumulative usage across multiple API calls (thread-safe for add)."""
     records: list[UsageRecord] = []
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
     
     @property
     def total_cost_usd(self) -> float:
@@ -44,7 +51,8 @@ class UsageTracker(BaseModel):
     
     def add(self, record: UsageRecord) -> None:
         """Add a usage record."""
-        self.records.append(record)
+        with self._lock:
+            self.records.append(record)
     
     def summary(self) -> dict:
         """Get a summary of all usage."""
@@ -88,6 +96,29 @@ def reset_tracker() -> None:
     _tracker_holder["tracker"] = UsageTracker()
 
 
+# Records logged in the current context, when a capture_usage() block is active
+_captured_records: ContextVar[list[UsageRecord] | None] = ContextVar("captured_records", default=None)
+
+
+@contextmanager
+def capture_usage() -> Iterator[list[UsageRecord]]:
+    """
+    Collect the usage records logged within this block.
+    
+    Unlike slicing the global tracker, this only sees records logged from
+    the current thread/context, so concurrent extractions don't mix usage.
+    
+    Yields:
+        List that receives each UsageRecord as it is logged
+    """
+    records: list[UsageRecord] = []
+    token = _captured_records.set(records)
+    try:
+        yield records
+    finally:
+        _captured_records.reset(token)
+
+
 def log(message: str) -> None:
     """Log an info message."""
     logger.info(message)
@@ -113,6 +144,8 @@ def log_usage(
     model: str,
     input_tokens: int = 0,
     output_tokens: int = 0,
+    cached_input_tokens: int = 0,
+    cache_write_input_tokens: int = 0,
     cost_usd: float | None = None,
     operation: str = "",
     **metadata: Any
@@ -123,8 +156,10 @@ def log_usage(
     Args:
         provider: Provider name (e.g., "bedrock", "openai", "google")
         model: Model identifier
-        input_tokens: Number of input tokens
+        input_tokens: Number of input tokens, including cache reads and writes
         output_tokens: Number of output tokens
+        cached_input_tokens: Input tokens served from the provider's prompt cache
+        cache_write_input_tokens: Input tokens written to the provider's prompt cache
         cost_usd: Cost in USD. If None, auto-calculated from pricing config.
         operation: Description of the operation
         **metadata: Any additional metadata to log
@@ -134,13 +169,19 @@ def log_usage(
     """
     # Auto-calculate cost if not provided
     if cost_usd is None:
-        cost_usd = calculate_cost(provider, model, input_tokens, output_tokens)
+        cost_usd = calculate_cost(
+            provider, model, input_tokens, output_tokens,
+            cached_input_tokens=cached_input_tokens,
+            cache_write_input_tokens=cache_write_input_tokens,
+        )
 
     record = UsageRecord(
         provider=provider,
         model=model,
         input_tokens=input_tokens,
         output_tokens=output_tokens,
+        cached_input_tokens=cached_input_tokens,
+        cache_write_input_tokens=cache_write_input_tokens,
         total_tokens=input_tokens + output_tokens,
         cost_usd=cost_usd,
         operation=operation,
@@ -148,9 +189,17 @@ def log_usage(
     )
 
     _tracker_holder["tracker"].add(record)
+    captured = _captured_records.get()
+    if captured is not None:
+        captured.append(record)
 
     log(f"[{provider}/{model}] {operation}")
-    if input_tokens or output_tokens:
+    if cached_input_tokens or cache_write_input_tokens:
+        log(
+            f"  Tokens: {input_tokens:,} in ({cached_input_tokens:,} cached, "
+            f"{cache_write_input_tokens:,} cache write) / {output_tokens:,} out"
+        )
+    elif input_tokens or output_tokens:
         log(f"  Tokens: {input_tokens:,} in / {output_tokens:,} out")
     if cost_usd > 0:
         log(f"  Cost: ${cost_usd:.6f}")
@@ -4,6 +4,8 @@ Shared prompts for extraction services.
 Contains prompts used across different providers for consistent behavior.
 """
 
+from pydantic_core import to_json
+
 # Base extraction rules shared by both vision and OCR prompts
 _BASE_EXTRACTION_RULES = """## CRITICAL: What to EXCLUDE (DO NOT extract these)
 - **Header information**: Project name, owner name, inspector name, date of inspection, inspection type, property address, unit number, or any metadata about the inspection itself
@@ -118,8 +120,9 @@ Additional context (example template):
 REMEMBER: Find the legend/key FIRST, then expand ALL acronyms to their full names. Extract ONLY inspection template sections with their fields. Do NOT include any header or footer information.
 """
 
-# OCR-based extraction prompt (for Deepseek two-step pipeline)
-OCR_EXTRACTION_PROMPT = """You are an inspection template parser. Given OCR-extracted text from an inspection form, extract ONLY the inspection template structure (rooms/areas with their inspection fields).
+# OCR-based extraction prompt (for Deepseek two-step pipeline), static part:
+# rules only, identical for every document
+OCR_EXTRACTION_SYSTEM_PROMPT = """You are an inspection template parser. Given OCR-extracted text from an inspection form, extract ONLY the inspection template structure (rooms/areas with their inspection fields).
 
 """ + _BASE_EXTRACTION_RULES + """
 
@@ -143,9 +146,11 @@ OCR_EXTRACTION_PROMPT = """You are an inspection template parser. Given OCR-extr
 - Text is marked with [PAGE N] to indicate page numbers
 - Preserve the exact order sections appear in the document
 
-""" + _CRITICAL_OUTPUT_RULES + """
+""" + _CRITICAL_OUTPUT_RULES
 
-OCR Text:
+# Per-document part of the OCR prompt. Sent as the user message after the
+# static system prompt above, so repeated calls share a cacheable prefix.
+OCR_EXTRACTION_USER_PROMPT = """OCR Text:
 {ocr_text}
 
 Additional context (example template):
@@ -154,6 +159,24 @@ Additional context (example template):
 REMEMBER: Find the legend/key FIRST, then expand ALL acronyms to their full names. Extract ONLY inspection template sections with their fields. Do NOT include any header or footer information.
 """
 
+# Legend pre-pass: resolve the form's abbreviation key from its first page
+OCR_LEGEND_PROMPT = """Below is OCR text from the first page of an inspection form. Find any legend, key, or abbreviation table (e.g. "G = Good", "Inc = Inconclusive", rating scales like "1 = Poor").
+
+List each abbreviation and its meaning, one per line, as "ABBREVIATION = Meaning". If there is no legend, reply with exactly: NONE
+
+OCR Text:
+{ocr_text}
+"""
+
+# Prepended to the OCR user prompt when the pre-pass found a legend
+OCR_LEGEND_SECTION = """Legend/key already found on page 1 (use these expansions):
+{legend}
+
+"""
+
+# Full single-message OCR prompt
+OCR_EXTRACTION_PROMPT = OCR_EXTRACTION_SYSTEM_PROMPT + "\n\n" + OCR_EXTRACTION_USER_PROMPT
+
 # Anthropic-specific prompt for structured outputs
 # Schema is enforced via output_format parameter, so we don't include it in the prompt
 VISION_EXTRACTION_PROMPT_ANTHROPIC = """You are an inspection template parser. Given images of an inspection form, extract ONLY the inspection template structure (rooms/areas with their inspection fields).
@@ -254,3 +277,17 @@ REMEMBER: Use the SAME section names as they appear in the document. Extract ONL
 # Legacy alias for backward compatibility
 EXTRACTION_PROMPT = VISION_EXTRACTION_PROMPT
 
+
+def render_template_context(context: dict | None) -> str:
+    """
+    Render the optional template context for the {template_context} slot.
+
+    Args:
+        context: Template dictionary, or None
+
+    Returns:
+        Indented JSON text, or "N/A" when there is no context
+    """
+    if not context:
+        return "N/A"
+    return to_json(context, indent=2).decode("utf-8")